@@ -1,77 +1,160 @@
+from functools import lru_cache, partial
 from typing import Any, Union, get_origin, get_args
 
-def is_type_match(value, expected_type, base_class) -> bool:
+
+@lru_cache(maxsize=4096)
+def _cached_origin_args(schema):
+    return get_origin(schema), get_args(schema)
+
+
+def _origin_args(schema):
+    """
+    Cached (get_origin, get_args) pair for a schema node.
+    Unhashable normalized schemas ({str: int}, [int], {int}) never carry a typing origin.
+    """
+    try:
+        return _cached_origin_args(schema)
+    except TypeError:
+        return None, ()
+
+
+def _origin(schema):
+    return _origin_args(schema)[0]
+
+
+def _args(schema):
+    return _origin_args(schema)[1]
+
+
+@lru_cache(maxsize=1024)
+def _plain_type_args(args: tuple):
+    """
+    args itself when every member is a plain class (Optional[int], Union[int, str]), else None.
+    Such unions reduce to a single isinstance(value, args) call.
+    """
+    return args if all(a.__class__ is type for a in args) else None
+
+
+def _unwrap_step(value, base_class):
+    # native copy of value with every base_class node inside it (keys included) replaced by to_native()
     if isinstance(value, base_class):
-        value = value.to_native()
-
-    origin = get_origin(expected_type)
-    args = get_args(expected_type)
-
-    # Handle Union[...] properly
-    if origin is Union:
-        return any(is_type_match(value, t, base_class) for t in args)
-
-    # List check
-    if origin is list:
-        if not isinstance(value, list):
-            return False
-        (item_type,) = args if args else (Any,)
-        return all(is_type_match(v, item_type, base_class) for v in value)
-
-    # Set check
-    if origin is set:
-        if not isinstance(value, set):
-            return False
-        (item_type,) = args if args else (Any,)
-        return all(is_type_match(v, item_type, base_class) for v in value)
-
-    # Dict check
-    if origin is dict:
-        if not isinstance(value, dict):
-            return False
-        key_type, val_type = args if len(args) == 2 else (Any, Any)
-        return all(
-            is_type_match(k, key_type, base_class) and is_type_match(v, val_type, base_class)
-            for k, v in value.items()
-        )
-
-    if origin is tuple:
-        if not isinstance(value, tuple):
-            return False
-        if args and args[-1] is Ellipsis:
-            item_type = args[0]
-            return all(is_type_match(v, item_type, base_class) for v in value)
-        if len(args) != len(value):
-            return False
-        return all(is_type_match(v, t, base_class) for v, t in zip(value, args))
-
-    # Fallback for built-in types
-    if isinstance(expected_type, type):
-        return isinstance(value, expected_type)
+        return None, value.to_native()
+    if isinstance(value, dict):
+        children = [(part, base_class) for item in value.items() for part in item]
+        return (lambda results: dict(zip(results[0::2], results[1::2]))), children
+    for container in (list, set, tuple):
+        if isinstance(value, container):
+            return container, [(v, base_class) for v in value]
+    return None, value
 
+
+def is_type_match(value, expected_type, base_class) -> bool:
+    """
+    True when value, with any base_class nodes in it converted to natives, matches expected_type.
+    Public helper kept for existing callers; it runs the same compiled matcher the validator uses.
+    """
+    if isinstance(value, (dict, list, set, tuple)) or isinstance(value, base_class):
+        value = _transform_iteratively(value, base_class, _unwrap_step)
+    return compile_type_match(expected_type)(value)
+
+
+# --- Compiled type matchers ---
+# Each expected type is lowered once into a specialized predicate over native values.
+def _always_match(value):
     return True
 
-def resolve_schema_key(key, schema):
-    origin = get_origin(schema)
-    args = get_args(schema)
 
-    if schema is None:
-        return None
+def _compile_union_match(args):
+    plain = _plain_type_args(args)
+    if plain is not None:
+        return lambda value: isinstance(value, plain)
+    preds = tuple(_compiled_match(t) for t in args)
+    return lambda value: any(p(value) for p in preds)
+
+
+def _compile_list_match(args):
+    item = _compiled_match(args[0] if args else Any)
+    return lambda value: isinstance(value, list) and all(item(v) for v in value)
+
+
+def _compile_set_match(args):
+    item = _compiled_match(args[0] if args else Any)
+    return lambda value: isinstance(value, set) and all(item(v) for v in value)
+
+
+def _compile_dict_match(args):
+    key_type, val_type = args if len(args) == 2 else (Any, Any)
+    key_pred, val_pred = _compiled_match(key_type), _compiled_match(val_type)
+    return lambda value: isinstance(value, dict) and all(key_pred(k) and val_pred(v) for k, v in value.items())
+
+
+def _compile_tuple_match(args):
+    if args and args[-1] is Ellipsis:
+        item = _compiled_match(args[0])
+        return lambda value: isinstance(value, tuple) and all(item(v) for v in value)
+    preds = tuple(_compiled_match(t) for t in args)
+    size = len(preds)
+    return lambda value: (isinstance(value, tuple) and len(value) == size
+                          and all(p(v) for p, v in zip(preds, value)))
+
+
+_MATCH_COMPILERS = {
+    Union: _compile_union_match,
+    list: _compile_list_match,
+    set: _compile_set_match,
+    dict: _compile_dict_match,
+    tuple: _compile_tuple_match,
+}
+
+
+@lru_cache(maxsize=4096)
+def _compiled_match(expected_type):
+    origin, args = _origin_args(expected_type)
+    compiler = _MATCH_COMPILERS.get(origin)
+    if compiler is not None:
+        return compiler(args)
+    if isinstance(expected_type, type):
+        return lambda value: isinstance(value, expected_type)
+    return _always_match
+
+
+def compile_type_match(expected_type):
+    """
+    Predicate for whether an already-native value matches expected_type (a type or typing generic).
+    """
+    try:
+        return _compiled_match(expected_type)
+    except TypeError:
+        # unhashable normalized schemas have no origin and are not types
+        return _always_match
+
+
+def make_key_resolver(schema):
+    """
+    key -> sub-schema lookup for one schema, returning None when nothing matches.
+    Type keys are bucketed once here instead of scanning schema.items() on every lookup.
+    """
+    origin, args = _origin_args(schema)
 
     # ✅ Dict[T, V]
     if origin is dict and len(args) == 2:
-        _, value_type = args
-        return value_type
+        value_type = args[1]
+        return lambda key: value_type
+
+    if not isinstance(schema, dict):
+        return lambda key: None
 
-    if isinstance(schema, dict):
+    typed_keys = tuple((key_types, schema[sk]) for sk, key_types in bucket_schema_keys(schema))
+
+    def resolve(key):
         if key in schema:
             return schema[key]
-
-        for k_type, v_type in schema.items():
-            if isinstance(k_type, type) and isinstance(key, k_type):
+        for key_types, v_type in typed_keys:
+            if isinstance(key, key_types):
                 return v_type
+        return None
 
-    return None
+    return resolve
 
 
 def validate_container_origins(origin, value, args, path, validate_type):
@@ -91,9 +174,13 @@ def validate_container_origins(origin, value, args, path, validate_type):
 
     if origin is dict and isinstance(value, dict):
         key_type, val_type = args if len(args) == 2 else (Any, Any)
+        seen = set()  # val_type is fixed here, so value identity is enough to skip repeats
         for k, v in value.items():
             validate_type(key_type, k, path=f"{path}.key")
-            validate_type(key_type, k, path=f"{path}.k")
+            if id(v) in seen:
+                continue
+            seen.add(id(v))
+            validate_type(val_type, v, path=f"{path}.{k}")
         return
 
 
@@ -122,8 +209,10 @@ def validate_set(expected, value, path, validate_type):
 
 def is_key_instance_of_type(key, key_type) -> bool:
     try:
-        origin = get_origin(key_type)
-        args = get_args(key_type)
+        if key_type.__class__ is type:
+            return isinstance(key, key_type)
+
+        origin, args = _origin_args(key_type)
 
         if origin is Union:
             return any(is_key_instance_of_type(key, t) for t in args)
@@ -137,41 +226,70 @@ def is_key_instance_of_type(key, key_type) -> bool:
         return False
 
 
-def get_default_from_type(tp):
-    # ✅ Handle tuple of types i.e Union
-    if isinstance(tp, tuple):
-        return get_default_from_type(tp[0])  # choose first type as fallback
-
-    # ✅ Handle set type
-    if isinstance(tp, set):
-        return set()
+_DEFAULT_FACTORIES = {
+    int: int, float: float, str: str, bool: bool, type(None): lambda: None,
+    list: list, set: set, dict: dict, tuple: tuple,
+}
 
-    # ✅ Handle list type
-    if isinstance(tp, list):
-        return []
+# normalized container schemas ({str: int}, [int], {int}) default to an empty container
+_SHAPE_DEFAULTS = {dict: dict, list: list, set: set}
 
-    # ✅ Handle tuple type
-    if isinstance(tp, tuple) and Ellipsis in tp:
-        return tuple()
-    if isinstance(tp, tuple):
-        return tuple(get_default_from_type(t) for t in tp)
 
-    # ✅ Handle dict type
-    if isinstance(tp, dict):
-        return {}
+def _none_default():
+    return None
 
-    # ✅ Handle concrete types
-    if tp in (int, float, str, bool):
-        return tp()
-
-    if tp is None or tp is type(None):
-        return None
 
+def _construct_or_none(tp):
     try:
         return tp()
     except Exception:
         return None
 
+
+def default_factory_for(tp):
+    """
+    Zero-argument callable producing get_default_from_type(tp).
+    Resolving it once per schema key leaves a single call per missing key.
+    """
+    # ✅ Handle concrete types with a single lookup
+    if tp.__class__ is type:
+        factory = _DEFAULT_FACTORIES.get(tp)
+        if factory is not None:
+            return factory
+
+    # ✅ Handle tuple of types i.e Union
+    if isinstance(tp, tuple) and tp:
+        return default_factory_for(tp[0])  # choose first type as fallback
+
+    # ✅ Handle normalized set / list / dict schemas
+    factory = _SHAPE_DEFAULTS.get(type(tp))
+    if factory is not None:
+        return factory
+
+    if tp is None:
+        return _none_default
+
+    return partial(_construct_or_none, tp)
+
+
+def get_default_from_type(tp):
+    return default_factory_for(tp)()
+
+
+def bucket_schema_keys(schema: dict) -> list:
+    """
+    Type-based keys of a normalized dict schema, in schema order, as (schema_key, types).
+    Exact keys don't need a bucket: `key in schema` is already a hash lookup.
+    """
+    typed = []
+    for sk in schema:
+        if isinstance(sk, type):
+            typed.append((sk, (sk,)))
+        elif isinstance(sk, tuple) and sk and all(isinstance(t, type) for t in sk):
+            typed.append((sk, sk))
+    return typed
+
+
 def coerce_key_to_type(key: Any, key_type: Any) -> Any:
     try:
         return key_type(key)
@@ -183,35 +301,26 @@ def coerce_dict_keys(data: dict, schema: Any) -> dict:
     if not isinstance(data, dict) or not isinstance(schema, dict):
         return data
 
+    typed_keys = bucket_schema_keys(schema)
+
     coerced = {}
     for k, v in data.items():
         matched_key_type = None
-        original_key = k  # Save for fallback
 
-        for sk in schema.keys():
-            if sk == k:
-                matched_key_type = sk
-                break
-            if isinstance(sk, type) and isinstance(k, str):
-                try:
-                    test_k = coerce_key_to_type(k, sk)
-                    if isinstance(test_k, sk):
+        if k in schema:
+            matched_key_type = k
+        else:
+            for sk, key_types in typed_keys:
+                # single type keys only coerce string keys, tuple keys try every member
+                if isinstance(sk, type) and not isinstance(k, str):
+                    continue
+                for t in key_types:
+                    test_k = coerce_key_to_type(k, t)
+                    if isinstance(test_k, t):
                         matched_key_type = sk
                         k = test_k
                         break
-                except Exception:
-                    continue
-            if isinstance(sk, tuple) and all(isinstance(t, type) for t in sk):
-                for t in sk:
-                    try:
-                        test_k = coerce_key_to_type(k, t)
-                        if isinstance(test_k, t):
-                            matched_key_type = sk
-                            k = test_k
-                            break
-                    except Exception:
-                        continue
-                if matched_key_type:
+                if matched_key_type is not None:
                     break
 
         subschema = schema.get(matched_key_type, None)
@@ -242,159 +351,281 @@ def coerce_dict_keys(data: dict, schema: Any) -> dict:
     return coerced
 #
 
-def coerce_keys_recursively(data: Any, schema: Any) -> Any:
-    origin = get_origin(schema)
-    args = get_args(schema)
+# --- Iterative tree transform shared by coerce_keys_recursively and normalize_data ---
+# A step function returns (None, value) for a finished node, or (build, children) for a container:
+# children are (data, schema) pairs and build(results) assembles the container once they are done.
+def _build_dict(keys):
+    return lambda results: dict(zip(keys, results))
+
+
+def _transform_iteratively(data: Any, schema: Any, step) -> Any:
+    # Explicit stack instead of recursion: deeply nested data can't hit the recursion limit.
+    # Children are pushed in reverse so nodes (and errors) are visited in the recursive order.
+    result = None
+    stack = [(data, schema, None, 0)]
+    while stack:
+        value, sub_schema, parent, slot = stack.pop()
+        build, out = step(value, sub_schema)
+        if build is not None:
+            if out:
+                # frame: [build, results, remaining, parent, slot]
+                frame = [build, [None] * len(out), len(out), parent, slot]
+                stack.extend((v, s, frame, i) for i, (v, s) in reversed(list(enumerate(out))))
+                continue
+            out = build(())
+
+        # fold finished values up into their parents
+        while parent is not None:
+            parent[1][slot] = out
+            parent[2] -= 1
+            if parent[2]:
+                break
+            out = parent[0](parent[1])
+            parent, slot = parent[3], parent[4]
+        else:
+            result = out
+    return result
 
-    # --- Dict[K, V] from typing ---
-    if origin is dict and isinstance(data, dict):
-        key_type, val_type = args if len(args) == 2 else (Any, Any)
-        coerced = {}
-        for k, v in data.items():
-            coerced_key = coerce_key_to_type(k, key_type)
-            coerced_val = coerce_keys_recursively(v, val_type)
-            coerced[coerced_key] = coerced_val
-        return coerced
-
-    # --- Set ---
-    if origin is set and isinstance(data, set):
-        (item_type,) = args if args else (Any,)
-        return {coerce_keys_recursively(i, item_type) for i in data}
-
-    # --- List ---
-    if origin is list and isinstance(data, list):
-        (item_type,) = args if args else (Any,)
-        return [coerce_keys_recursively(i, item_type) for i in data]
-
-    # --- Tuple ---
-    if origin is tuple and isinstance(data, tuple):
-        if args and args[-1] is Ellipsis:
-            return tuple(coerce_keys_recursively(i, args[0]) for i in data)
-        return tuple(coerce_keys_recursively(i, s) for i, s in zip(data, args))
+
+# Scalars whose constructor returns an equal value when given an exact instance
+_SCALAR_TYPES = frozenset((int, float, str, bool, bytes))
+
+
+def _keys_already_typed(data: dict, key_type: Any) -> bool:
+    # Any(k) always fails and leaves k alone; exact scalar keys would be rebuilt unchanged
+    return key_type is Any or (key_type in _SCALAR_TYPES and all(k.__class__ is key_type for k in data))
+
+
+def _coerce_keys(data: dict, key_type: Any) -> list:
+    if _keys_already_typed(data, key_type):
+        return list(data)
+    return [coerce_key_to_type(k, key_type) for k in data]
+
+
+# --- coerce_keys_recursively steps, keyed by typing origin ---
+def _is_coerce_leaf(schema) -> bool:
+    # nothing below a leaf schema has keys to coerce
+    return _origin_args(schema)[0] not in _COERCE_DISPATCH and not isinstance(schema, dict)
+
+
+def _coerce_typed_dict(data, args):
+    if not isinstance(data, dict):
+        return None, data
+    key_type, val_type = args if len(args) == 2 else (Any, Any)
+    keys = _coerce_keys(data, key_type)
+    if _is_coerce_leaf(val_type):
+        return None, dict(zip(keys, data.values()))
+    return _build_dict(keys), [(v, val_type) for v in data.values()]
+
+
+def _coerce_typed_set(data, args):
+    if not isinstance(data, set):
+        return None, data
+    (item_type,) = args if args else (Any,)
+    if _is_coerce_leaf(item_type):
+        return None, set(data)
+    return set, [(i, item_type) for i in data]
+
+
+def _coerce_typed_list(data, args):
+    if not isinstance(data, list):
+        return None, data
+    (item_type,) = args if args else (Any,)
+    if _is_coerce_leaf(item_type):
+        return None, list(data)
+    return list, [(i, item_type) for i in data]
+
+
+def _coerce_typed_tuple(data, args):
+    if not isinstance(data, tuple):
+        return None, data
+    if args and args[-1] is Ellipsis:
+        if _is_coerce_leaf(args[0]):
+            return None, data
+        return tuple, [(i, args[0]) for i in data]
+    if all(_is_coerce_leaf(a) for a in args):
+        return None, data[:len(args)]
+    return tuple, list(zip(data, args))
+
+
+_COERCE_DISPATCH = {
+    dict: _coerce_typed_dict,
+    set: _coerce_typed_set,
+    list: _coerce_typed_list,
+    tuple: _coerce_typed_tuple,
+}
+
+
+def _coerce_step(data: Any, schema: Any):
+    origin, args = _origin_args(schema)
+
+    # --- Dict[K, V] / Set[T] / List[T] / Tuple[...] from typing ---
+    handler = _COERCE_DISPATCH.get(origin)
+    if handler is not None:
+        return handler(data, args)
 
     # --- Explicit schema dict: TypedDict-style ---
     if isinstance(schema, dict) and isinstance(data, dict):
-        coerced = {}
+        typed_keys = bucket_schema_keys(schema)
+        children = []
         for k, v in data.items():
-            matched_key = k
-            matched_val_schema = Any
+            if k in schema:
+                matched_val_schema = schema[k]
+            else:
+                matched_val_schema = next((schema[sk] for sk, key_types in typed_keys if isinstance(k, key_types)), Any)
+            children.append((v, matched_val_schema))
+        return _build_dict(list(data)), children
 
-            for sk, sv in schema.items():
-                if isinstance(sk, type) and isinstance(k, sk):
-                    matched_val_schema = sv
-                    break
-                if isinstance(sk, tuple) and any(isinstance(k, t) for t in sk):
-                    matched_val_schema = sv
-                    break
-                if sk == k:
-                    matched_val_schema = sv
-                    break
+    return None, data
 
-            coerced[matched_key] = coerce_keys_recursively(v, matched_val_schema)
-        return coerced
 
-    return data
+def coerce_keys_recursively(data: Any, schema: Any) -> Any:
+    return _transform_iteratively(data, schema, _coerce_step)
 
-def normalize_data(data: Any, schema: Any) -> Any:
-    origin = get_origin(schema)
-    args = get_args(schema)
 
-    # --- typing.Dict[K, V] ---
-    if origin is dict and isinstance(data, dict):
-        key_type, val_type = args if len(args) == 2 else (Any, Any)
-        result = {}
-        for k, v in data.items():
-            coerced_key = coerce_key_to_type(k, key_type)
-            result[coerced_key] = normalize_data(v, val_type)
-        return result
-
-    # --- typing.Set[T] ---
-    if origin is set:
-        item_type = args[0] if args else Any
-        if isinstance(data, (list, set)):
-            return {normalize_data(i, item_type) for i in data}
-        raise TypeError(f"[normalize_data] Expected set or list, got {type(data)}")
-
-    # --- typing.List[T] ---
-    if origin is list:
-        item_type = args[0] if args else Any
-        if not isinstance(data, list):
-            raise TypeError(f"[normalize_data] Expected list, got {type(data)}")
-        return [normalize_data(i, item_type) for i in data]
-
-    # --- typing.Tuple[T1, T2, ...] or Tuple[T, ...] ---
-    if origin is tuple:
-        if isinstance(data, list):
-            data = tuple(data)
-        if not isinstance(data, tuple):
-            raise TypeError(f"[normalize_data] Expected tuple, got {type(data)}")
-        if args and args[-1] is Ellipsis:
-            return tuple(normalize_data(i, args[0]) for i in data)
-        return tuple(normalize_data(i, s) for i, s in zip(data, args))
-
-    # --- Explicit schema dict (TypedDict-style) ---
-    if isinstance(schema, dict) and isinstance(data, dict):
-        normalized = {}
-        for k, v in data.items():
-            coerced_key = k
-            matched_schema = Any
+# --- normalize_data steps for typing generics, keyed by origin ---
+def _normalize_typed_dict(data, args):
+    if not isinstance(data, dict):
+        return None, data
+    key_type, val_type = args if len(args) == 2 else (Any, Any)
+    keys = _coerce_keys(data, key_type)
+    return _build_dict(keys), [(v, val_type) for v in data.values()]
 
-            for sk, sv in schema.items():
-                # match against exact key or type
-                if sk == k:
-                    matched_schema = sv
-                    break
-                if isinstance(sk, type):
-                    try:
-                        coerced = coerce_key_to_type(k, sk)
-                        if isinstance(coerced, sk):
-                            coerced_key = coerced
-                            matched_schema = sv
-                            break
-                    except Exception:
-                        continue
-                if isinstance(sk, tuple) and all(isinstance(t, type) for t in sk):
-                    for t in sk:
-                        try:
-                            coerced = coerce_key_to_type(k, t)
-                            if isinstance(coerced, t):
-                                coerced_key = coerced
-                                matched_schema = sv
-                                break
-                        except Exception:
-                            continue
-
-            normalized[coerced_key] = normalize_data(v, matched_schema)
-        return normalized
-
-    # --- Normalized set schema like {str} ---
-    if isinstance(schema, set) and len(schema) == 1:
-        (item_type,) = tuple(schema)
-        if isinstance(data, (list, set)):
-            return {normalize_data(i, item_type) for i in data}
-        raise TypeError(f"[normalize_data] Expected list or set for set schema, got {type(data)}")
-
-    # --- Normalized list schema like [int] ---
-    if isinstance(schema, list) and len(schema) == 1:
-        item_type = schema[0]
-        if isinstance(data, list):
-            return [normalize_data(i, item_type) for i in data]
-        raise TypeError(f"[normalize_data] Expected list for list schema, got {type(data)}")
-
-    # --- Normalized tuple schema like (int, str) or (T, ...) ---
-    if isinstance(schema, tuple):
-        if isinstance(data, list):
-            data = tuple(data)
-        if len(schema) == 2 and schema[1] is Ellipsis:
-            return tuple(normalize_data(i, schema[0]) for i in data)
-        return tuple(normalize_data(i, s) for i, s in zip(data, schema))
-
-    # --- Fallback scalar cast ---
+
+def _normalize_typed_set(data, args):
+    item_type = args[0] if args else Any
+    if isinstance(data, (list, set)):
+        return set, [(i, item_type) for i in data]
+    raise TypeError(f"[normalize_data] Expected set or list, got {type(data)}")
+
+
+def _normalize_typed_list(data, args):
+    item_type = args[0] if args else Any
+    if not isinstance(data, list):
+        raise TypeError(f"[normalize_data] Expected list, got {type(data)}")
+    return list, [(i, item_type) for i in data]
+
+
+def _normalize_typed_tuple(data, args):
+    if isinstance(data, list):
+        data = tuple(data)
+    if not isinstance(data, tuple):
+        raise TypeError(f"[normalize_data] Expected tuple, got {type(data)}")
+    if args and args[-1] is Ellipsis:
+        return tuple, [(i, args[0]) for i in data]
+    return tuple, list(zip(data, args))
+
+
+_NO_MATCH = object()
+# dict.get default for "key absent", so stored None/falsy values stay distinguishable in one lookup
+_MISS = object()
+
+
+def _coerce_to_any(key, key_types):
+    for t in key_types:
+        coerced = coerce_key_to_type(key, t)
+        if isinstance(coerced, t):
+            return coerced
+    return _NO_MATCH
+
+
+# --- normalize_data steps for normalized schemas, keyed by schema shape ---
+def _normalize_record(data, schema):
+    if not isinstance(data, dict):
+        return None, data
+    typed_keys = bucket_schema_keys(schema)
+    keys, children = [], []
+    for k, v in data.items():
+        # exact key first, then type keys (coercing the key) in schema order
+        if k in schema:
+            keys.append(k)
+            children.append((v, schema[k]))
+            continue
+
+        coerced_key, matched_schema = k, Any
+        for sk, key_types in typed_keys:
+            coerced = _coerce_to_any(k, key_types)
+            if coerced is not _NO_MATCH:
+                coerced_key, matched_schema = coerced, schema[sk]
+                break
+
+        keys.append(coerced_key)
+        children.append((v, matched_schema))
+    return _build_dict(keys), children
+
+
+def _normalize_set_schema(data, schema):
+    if len(schema) != 1:
+        return None, data
+    (item_type,) = tuple(schema)
+    if isinstance(data, (list, set)):
+        return set, [(i, item_type) for i in data]
+    raise TypeError(f"[normalize_data] Expected list or set for set schema, got {type(data)}")
+
+
+def _normalize_list_schema(data, schema):
+    if len(schema) != 1:
+        return None, data
+    item_type = schema[0]
+    if isinstance(data, list):
+        return list, [(i, item_type) for i in data]
+    raise TypeError(f"[normalize_data] Expected list for list schema, got {type(data)}")
+
+
+def _normalize_tuple_schema(data, schema):
+    if isinstance(data, list):
+        data = tuple(data)
+    if len(schema) == 2 and schema[1] is Ellipsis:
+        return tuple, [(i, schema[0]) for i in data]
+    return tuple, list(zip(data, schema))
+
+
+def _cast_scalar(data, schema):
+    if data.__class__ is schema and schema in _SCALAR_TYPES:
+        return data
+    try:
+        return schema(data)
+    except Exception:
+        return data
+
+
+_NORMALIZE_ORIGIN_DISPATCH = {
+    dict: _normalize_typed_dict,
+    set: _normalize_typed_set,
+    list: _normalize_typed_list,
+    tuple: _normalize_typed_tuple,
+}
+
+_NORMALIZE_SHAPE_DISPATCH = {
+    dict: _normalize_record,
+    set: _normalize_set_schema,
+    list: _normalize_list_schema,
+    tuple: _normalize_tuple_schema,
+}
+
+
+def _normalize_step(data: Any, schema: Any):
+    if schema.__class__ is type:
+        return None, _cast_scalar(data, schema)
+
+    origin, args = _origin_args(schema)
+
+    # --- typing.Dict[K, V] / Set[T] / List[T] / Tuple[...] ---
+    handler = _NORMALIZE_ORIGIN_DISPATCH.get(origin)
+    if handler is not None:
+        return handler(data, args)
+
+    # --- Normalized schemas: {k: T}, {str}, [int], (int, str) / (T, ...) ---
+    handler = _NORMALIZE_SHAPE_DISPATCH.get(type(schema))
+    if handler is not None:
+        return handler(data, schema)
+
+    # --- Fallback scalar cast (classes with a custom metaclass) ---
     if isinstance(schema, type):
-        try:
-            return schema(data)
-        except Exception:
-            return data
+        return None, _cast_scalar(data, schema)
 
-    return data
+    return None, data
 
+
+def normalize_data(data: Any, schema: Any) -> Any:
+    return _transform_iteratively(data, schema, _normalize_step)
@@ -1,13 +1,13 @@
 # from Meta import SchemaValidator
+from functools import lru_cache
 from Meta.meta_core import META_TYPES, MetaNodeMixin, wrap_meta_structure
 from Meta.schema_validator import NoOpValidator, SchemaValidator
 from Meta.helpers import is_key_instance_of_type
 import types
-from Meta.schema import Schema, fill_missing_keys
+from Meta.schema import Schema, normalize_with_plan, fill_missing_with_plan
 from Meta.helpers import get_default_from_type
-from typing import Any, Dict, List, Set, Union, Tuple, get_args, get_origin, Optional, get_type_hints, TypeVar
+from typing import Any, Dict, List, Set, Union, Tuple, get_args, get_origin, Optional, get_type_hints, TypeVar, Iterable
 from Meta.helpers import coerce_dict_keys
-from helpers import coerce_keys_recursively, normalize_data
 
 T = TypeVar("T", bound=MetaNodeMixin)
 
@@ -17,33 +17,104 @@ def is_instance_of_union(value, union_type):
         return any(isinstance(value, t) for t in get_args(union_type))
     return False
 
- 
+
+# --- deduce_schema memoization ---
+_DEDUCE_CACHE_SIZE = 1024
+_deduce_cache: Dict[tuple, Any] = {}
+
+
+def _shape(value):
+    """
+    Structural signature of a value: everything deduce_schema looks at, nothing else.
+    """
+    if value is None:
+        return type(None)
+    if isinstance(value, dict):
+        return "d", frozenset(type(k) for k in value), frozenset(_shape(v) for v in value.values())
+    if isinstance(value, list):
+        return "l", frozenset(_shape(v) for v in value)
+    if isinstance(value, set):
+        return "s", frozenset(_shape(v) for v in value)
+    if isinstance(value, tuple):
+        return "t", tuple(_shape(v) for v in value)
+    return type(value)
+
+
+# --- Interned typing aliases (deduce / merge rebuild the same ones constantly) ---
+@lru_cache(maxsize=1024)
+def _union_alias(args: tuple):
+    return Union[args]
+
+
+def _union(types_) -> Any:
+    # sorted so Union[int, str] and Union[str, int] share one entry and a stable arg order
+    return _union_alias(tuple(sorted(types_, key=repr)))
+
+
+@lru_cache(maxsize=1024)
+def _dict_alias(k, v):
+    return Dict[k, v]
+
+
+@lru_cache(maxsize=1024)
+def _list_alias(t):
+    return List[t]
+
+
+@lru_cache(maxsize=1024)
+def _set_alias(t):
+    return Set[t]
+
+
+@lru_cache(maxsize=1024)
+def _tuple_alias(args: tuple):
+    return Tuple[args]
+
+
+def _distinct_types(types_) -> tuple:
+    # typing aliases are interned, so identity is enough to dedup in one pass
+    seen = {}
+    for t in types_:
+        seen.setdefault(id(t), t)
+    return tuple(seen.values())
+
+
 class Meta:
-    def __new__(cls, data: META_TYPES, schema: Any = None, **kwargs) -> META_TYPES:
-        kwargs = kwargs if kwargs else {}
-        schema_obj = schema if isinstance(schema, Schema) else Schema(schema, **kwargs)
+    # Meta(...) always returns a wrapped Meta* node, never a Meta instance
+    __slots__ = ()
 
-        if kwargs.get("additional"):
-            schema_obj = Schema(Meta._merge_additional_schema(schema_obj.schema, kwargs["additional"]), **kwargs)
+    def __new__(cls, data: META_TYPES, schema: Any = None, **kwargs) -> META_TYPES:
+        return Meta._wrap(data, Meta._build_schema(schema, **kwargs), **kwargs)
 
-        fill_defaults = kwargs.get("fill_defaults")
-        if fill_defaults and isinstance(data, dict) and isinstance(schema_obj.schema, dict):
-            fill_missing_keys(data, schema_obj.schema)
+    @classmethod
+    def bulk(cls, data_iter: Iterable[Any], schema: Any = None, **kwargs) -> List[META_TYPES]:
+        """
+        Wrap every item of data_iter against one schema.
+        The Schema, its compiled plan and its validator are built once and shared by all returned nodes.
+        """
+        schema_obj = Meta._build_schema(schema, **kwargs)
+        return [Meta._wrap(data, schema_obj, **kwargs) for data in data_iter]
 
-        data = normalize_data(data, schema_obj.schema)
+    @staticmethod
+    def _build_schema(schema: Any, **kwargs) -> Schema:
+        additional = kwargs.get("additional")
+        if additional:
+            raw_schema = schema.schema if isinstance(schema, Schema) else schema
+            return Schema(_merge_additional(raw_schema, additional), **kwargs)
+        return schema if isinstance(schema, Schema) else Schema(schema, **kwargs)
 
-        try:
-            wrapped = wrap_meta_structure(data, schema=schema_obj, **kwargs)
-        except Exception as e:
-            print(str(e))
-            print("DATA: ", data)
-            print("SCHEMA: ", schema_obj.schema)
-            exit(0)
-        cls.schema = schema_obj
+    @staticmethod
+    def _wrap(data: Any, schema_obj: Schema, **kwargs) -> META_TYPES:
+        plan = schema_obj.plan
 
+        fill_defaults = kwargs.get("fill_defaults")
+        if fill_defaults and isinstance(data, dict) and isinstance(schema_obj.schema, dict):
+            fill_missing_with_plan(data, plan)
 
+        data = normalize_with_plan(data, plan)
 
-        return wrapped
+        # wrap_meta_structure attaches schema_obj to the returned node itself
+        return wrap_meta_structure(data, schema=schema_obj, **kwargs)
 
     @staticmethod
     def convert_from_optional(tp):
@@ -75,34 +146,36 @@ class Meta:
             # --- Dict detection ---
             if isinstance(value, dict):
                 if not value:
-                    return Dict[Any, Any]
+                    return _dict_alias(Any, Any)
 
-                key_types = {type(k) for k in value}
-                val_types = {_deduce(v) for v in value.values()}
+                # keys are nearly always homogeneous: stop at the first mismatch instead of building a set
+                key_type = type(next(iter(value)))
+                if any(type(k) is not key_type for k in value):
+                    key_type = _union({type(k) for k in value})
 
-                key_type = key_types.pop() if len(key_types) == 1 else Union[key_types]
-                val_type = val_types.pop() if len(val_types) == 1 else Union[val_types]
-                return Dict[key_type, val_type]
+                val_types = _distinct_types(map(_deduce, value.values()))
+                val_type = val_types[0] if len(val_types) == 1 else _union(val_types)
+                return _dict_alias(key_type, val_type)
 
             # --- List detection ---
             if isinstance(value, list):
                 if not value:
-                    return List[Any]
-                item_types = {_deduce(v) for v in value}
-                return List[item_types.pop()] if len(item_types) == 1 else List[Union[tuple(item_types)]]
+                    return _list_alias(Any)
+                item_types = _distinct_types(map(_deduce, value))
+                return _list_alias(item_types[0] if len(item_types) == 1 else _union(item_types))
 
             # --- Set detection ---
             if isinstance(value, set):
                 if not value:
-                    return Set[Any]
-                item_types = {_deduce(v) for v in value}
-                return Set[item_types.pop()] if len(item_types) == 1 else Set[Union[tuple(item_types)]]
+                    return _set_alias(Any)
+                item_types = _distinct_types(map(_deduce, value))
+                return _set_alias(item_types[0] if len(item_types) == 1 else _union(item_types))
 
             # --- Tuple detection ---
             if isinstance(value, tuple):
                 if not value:
-                    return Tuple[()]
-                return Tuple[tuple(_deduce(v) for v in value)]
+                    return _tuple_alias(())
+                return _tuple_alias(tuple(_deduce(v) for v in value))
 
             # --- Fallback for scalar types ---
             return type(value)
@@ -121,15 +194,15 @@ class Meta:
 
                 merged_k = _merge_schema(k1, k2)
                 merged_v = _merge_schema(v1, v2)
-                return Dict[merged_k, merged_v]
+                return _dict_alias(merged_k, merged_v)
 
             # --- Merge Union types ---
             if origin_a == Union or origin_b == Union:
                 args_a = set(get_args(a)) if origin_a == Union else {a}
                 args_b = set(get_args(b)) if origin_b == Union else {b}
-                return Union[tuple(args_a | args_b)]
+                return _union(args_a | args_b)
 
-            return Union[a, b] if a != b else a
+            return _union((a, b)) if a != b else a
 
         def _merge_nested_schema(a: Any, b: Any) -> Any:
             if isinstance(a, dict) and isinstance(b, dict):
@@ -142,8 +215,14 @@ class Meta:
 
             return _merge_schema(a, b)
 
-        # --- Step 1: infer schema from data ---
-        inferred = _deduce(data)
+        # --- Step 1: infer schema from data (memoized on its shape) ---
+        sig = _shape(data)
+        inferred = _deduce_cache.get(sig)
+        if inferred is None:
+            inferred = _deduce(data)
+            if len(_deduce_cache) >= _DEDUCE_CACHE_SIZE:
+                _deduce_cache.clear()
+            _deduce_cache[sig] = inferred
 
         # --- Step 2: merge in additional schema info ---
         if additional:
@@ -152,7 +231,7 @@ class Meta:
             elif get_origin(inferred) is dict:
                 k_type, v_type = get_args(inferred)
                 add_v = _deduce(additional)
-                inferred = Dict[k_type, _merge_schema(v_type, add_v)]
+                inferred = _dict_alias(k_type, _merge_schema(v_type, add_v))
 
         return inferred
 
@@ -172,7 +251,7 @@ class Meta:
                 k2, v2 = get_args(b)
                 merged_k = _merge(k1, k2)
                 merged_v = _merge(v1, v2)
-                return Dict[merged_k, merged_v]
+                return _dict_alias(merged_k, merged_v)
 
             # --- Merge TypedDict-like dicts (explicit fields) ---
             if isinstance(a, dict) and isinstance(b, dict):
@@ -188,24 +267,24 @@ class Meta:
             if origin_a in (list, List) and origin_b in (list, List):
                 (item_a,) = get_args(a) or (Any,)
                 (item_b,) = get_args(b) or (Any,)
-                return List[_merge(item_a, item_b)]
+                return _list_alias(_merge(item_a, item_b))
 
             if origin_a in (set, Set) and origin_b in (set, Set):
                 (item_a,) = get_args(a) or (Any,)
                 (item_b,) = get_args(b) or (Any,)
-                return Set[_merge(item_a, item_b)]
+                return _set_alias(_merge(item_a, item_b))
 
             if origin_a in (tuple, Tuple) and origin_b in (tuple, Tuple):
                 args_a = get_args(a)
                 args_b = get_args(b)
                 if args_a[-1:] == (Ellipsis,) and args_b[-1:] == (Ellipsis,):
-                    return Tuple[_merge(args_a[0], args_b[0]), ...]
+                    return _tuple_alias((_merge(args_a[0], args_b[0]), ...))
                 if len(args_a) == len(args_b):
-                    return Tuple[tuple(_merge(x, y) for x, y in zip(args_a, args_b))]
-                return Union[a, b]  # fallback
+                    return _tuple_alias(tuple(_merge(x, y) for x, y in zip(args_a, args_b)))
+                return _union((a, b))  # fallback
 
             # --- Do NOT use Union for dicts with structural overlap ---
-            return Union[a, b] if a != b else a
+            return _union((a, b)) if a != b else a
 
         return _merge(base, additional)
 
@@ -246,5 +325,15 @@ class Meta:
         ...
 
 
+@lru_cache(maxsize=256)
+def _merge_additional_cached(base: Any, additional: Any) -> Any:
+    return Meta._merge_additional_schema(base, additional)
 
 
+def _merge_additional(base: Any, additional: Any) -> Any:
+    # typing-based schemas are immutable and hashable, so their merges can be memoized
+    try:
+        hash((base, additional))
+    except TypeError:
+        return Meta._merge_additional_schema(base, additional)
+    return _merge_additional_cached(base, additional)
@@ -1,44 +1,135 @@
 # --- Schema + Normalization Stubs ---
 from abc import abstractmethod
 from typing import Union
-from Meta.schema_validator import SchemaValidator
+from Meta.schema_validator import SchemaValidator, NOOP_VALIDATOR
+
+
+# --- Shared validators, one per (schema, owner) ---
+_VALIDATOR_CACHE_SIZE = 1024
+_VALIDATOR_CACHE: dict = {}
+# same validators keyed by schema content, so re-parsed but equal schemas still share one
+_VALIDATOR_BY_CONTENT: dict = {}
+
+# is_valid outcomes for immutable scalar nodes: (node type, native value, id(validator)) -> (validator, result)
+_VALIDITY_CACHE_SIZE = 1024
+_VALIDITY_CACHE: dict = {}
+
+_SCALAR_TUPLE = (str, int, float, bool)
+_CONTAINER_TUPLE = (dict, list, set)
+_CONTAINER_TYPES = frozenset(_CONTAINER_TUPLE)
+
+# schema-less nodes all share this one; nothing to validate against
+_NULL_VALIDATOR = NOOP_VALIDATOR
+
+
+def _freeze(schema):
+    """
+    Hashable stand-in for a normalized schema with the same content.
+    Container kinds are tagged so {int}, [int] and (int,) stay distinct.
+    """
+    if isinstance(schema, dict):
+        return dict, tuple((_freeze(k), _freeze(v)) for k, v in schema.items())
+    if isinstance(schema, list):
+        return list, tuple(_freeze(i) for i in schema)
+    if isinstance(schema, set):
+        return set, frozenset(_freeze(i) for i in schema)
+    if isinstance(schema, tuple):
+        return tuple, tuple(_freeze(i) for i in schema)
+    hash(schema)  # anything else must already be hashable
+    return schema
+
+
+def _schema_key(schema):
+    try:
+        return _freeze(schema)
+    except TypeError:
+        return None  # no content key; identity caching only
+
+
+def _get_validator(schema, owner):
+    if schema is None:
+        return _NULL_VALIDATOR
+    key = (id(schema), owner)
+    entry = _VALIDATOR_CACHE.get(key)
+    # entries hold their schema, so a cached id can't be reused by another object
+    if entry is not None and entry[0] is schema:
+        return entry[1]
+
+    content_key = _schema_key(schema)
+    validator = None if content_key is None else _VALIDATOR_BY_CONTENT.get((content_key, owner))
+    if validator is None:
+        validator = SchemaValidator(schema, owner)
+        if content_key is not None:
+            if len(_VALIDATOR_BY_CONTENT) >= _VALIDATOR_CACHE_SIZE:
+                _VALIDATOR_BY_CONTENT.clear()
+            _VALIDATOR_BY_CONTENT[(content_key, owner)] = validator
+
+    if len(_VALIDATOR_CACHE) >= _VALIDATOR_CACHE_SIZE:
+        _VALIDATOR_CACHE.clear()
+    _VALIDATOR_CACHE[key] = (schema, validator)
+    return validator
+
+
+def _shared_validator(self):
+    return _get_validator(self.schema, type(self))
+
+
+def _ignore_validator(self, _):
+    # derived from schema; accepted so callers can treat every node alike
+    pass
+
+
+# For nodes that only keep `schema`: the validator comes from the shared cache instead of the instance
+_shared_validator_property = property(_shared_validator, _ignore_validator)
+
 
 class MetaNodeMixin:
-    def __new__(cls, *args, **kwargs):
-        schema = kwargs.pop("schema", None)
+    # no __dict__ of its own; lets lightweight subclasses declare their own slots
+    __slots__ = ()
+
+    def __new__(cls, *args, schema=None, **kwargs):
         instance = super().__new__(cls, *args, **kwargs)
 
+        if schema is None:
+            instance.schema = None
+            instance.validator = _NULL_VALIDATOR
+            return instance
+
         instance.schema = schema
-        instance.validator = SchemaValidator(schema, MetaNodeMixin)
+        instance.validator = _get_validator(schema, MetaNodeMixin)
 
-        # Validate scalar value directly
-        if args and isinstance(instance, (str, int, float, bool)):
+        # Validate scalar value directly (instance is always a Meta* subclass, so no exact-type shortcut)
+        if args and isinstance(instance, _SCALAR_TUPLE):
             try:
-                instance.validator.type_check(args[0], schema, key_path=cls.__name__)
+                instance.validator.bind(schema, cls.__name__)(args[0])
             except Exception as e:
                 raise TypeError(f"[ValidationError in {cls.__name__}] {e}")
+            instance._validated = True
 
-        elif args and isinstance(args[0], (dict, list, set)):
+        # exact built-in containers hit the frozenset; subclasses take the isinstance path
+        elif args and (type(args[0]) in _CONTAINER_TYPES or isinstance(args[0], _CONTAINER_TUPLE)):
             try:
                 instance.validator.validate_all(args[0])
 
             except Exception as e:
                 raise TypeError(f"[ValidationError in {cls.__name__}] {e}")
+            instance._validated = True
 
         return instance
 
-    def __init__(self, *args, **kwargs):
-        schema = getattr(self, "schema", kwargs.get("schema", None))
-        self.schema = schema
-        self.validator = SchemaValidator(schema, MetaNodeMixin)
+    def __init__(self, *args, schema=None, **kwargs):
+        # schema and validator were attached in __new__
         try:
             super().__init__(*args, **kwargs)
 
         except TypeError:
             pass  # Scalars will raise on init
 
-        # validate the constructed object
-        if hasattr(self, "schema") and self.schema is not None:
+        # validate the constructed object, unless __new__ just validated the same value
+        validated = getattr(self, "_validated", False)
+        if validated:
+            del self._validated
+        elif self.schema is not None:
             try:
                 self.validator.validate_all(self)
             except Exception as e:
@@ -48,14 +139,15 @@ class MetaNodeMixin:
         print(f"[🧠 Schema Debug] {self.__class__.__name__} schema = {self.schema}")
 
     def validate(self):
-        if not hasattr(self, "schema") or self.schema is None:
+        if self.schema is None:
             raise ValueError("No schema associated with this node.")
-        SchemaValidator(self.schema, MetaNodeMixin).validate_all( self)
+        _get_validator(self.schema, MetaNodeMixin).validate_all(self)
 
     def validate_recursively(self, recursive=False):
-        if not hasattr(self, "schema") or self.schema is None:
+        if self.schema is None:
             raise ValueError("No schema associated with this node.")
-        validator = SchemaValidator(self.schema, MetaNodeMixin)
+        # the node's own validator, attached at construction; never rebuilt per call
+        validator = self.validator
         if recursive and isinstance(self, (dict, list, set)):
             validator.validate_all(self)
         else:
@@ -69,11 +161,25 @@ class MetaNodeMixin:
         return isinstance(self.to_native(), bool)
 
     def is_valid(self):
-        try:
-            self.validator.validate_all(self)
+        validator = self.validator
+        if validator is _NULL_VALIDATOR:
             return True
-        except (TypeError, ValueError, BaseException):
-            return False
+
+        # containers can change after construction; only immutable scalars are memoized
+        if not isinstance(self, (str, int, float)):
+            return validator.check(self)
+
+        key = (type(self), self.to_native(), id(validator))
+        entry = _VALIDITY_CACHE.get(key)
+        # entries hold their validator, so a cached id can't be reused by another object
+        if entry is not None and entry[0] is validator:
+            return entry[1]
+        result = validator.check(self)
+        if len(_VALIDITY_CACHE) >= _VALIDITY_CACHE_SIZE:
+            _VALIDITY_CACHE.clear()
+        _VALIDITY_CACHE[key] = (validator, result)
+        return result
+
 
     def update(self, _):
         pass
@@ -84,6 +190,8 @@ class MetaNodeMixin:
 
 
     def __eq__(self, other):
+        if other is self:
+            return True
         return self.to_native() == other
 
     @abstractmethod
@@ -99,49 +207,94 @@ class MetaNodeMixin:
 # types that cannot be subclassed directly
 # --- MetaBool: Subclass of int with bool behavior ---
 class MetaBool(int, MetaNodeMixin):
+    # int subclasses can't take non-empty __slots__, so schema and _native live in __dict__
+    validator = _shared_validator_property
+
+    # class-wide default schema and its bound check, set through configure()
+    _schema = None
+    _type_check = None
+
+    @classmethod
+    def configure(cls, schema):
+        """
+        Default schema for MetaBool(value) calls that don't pass one.
+        Its check is bound once here instead of being looked up on every construction.
+        """
+        cls._schema = schema
+        cls._type_check = None if schema is None else _get_validator(schema, MetaBool).bind(schema, "MetaBool")
+
     def __new__(cls, value: Union[bool, int], schema=None):
-        coerced = 1 if value else 0
+        native = bool(value)
+
+        if schema is None:
+            schema, type_check = cls._schema, cls._type_check
+        else:
+            type_check = _get_validator(schema, MetaBool).bind(schema, "MetaBool")
 
         # --- Perform schema validation BEFORE instantiating ---
-        if schema is not None:
-            SchemaValidator(schema, MetaBool).type_check(value, schema, key_path="MetaBool")
+        if type_check is not None:
+            type_check(value)
 
-        instance = super().__new__(cls, coerced)
+        # int(True) == 1, so the bool goes straight into the int payload
+        instance = super().__new__(cls, native)
         instance.schema = schema
-        instance.validator = SchemaValidator(schema, MetaBool)
+        instance._native = native
         return instance
 
     def __init__(self, value: Union[bool, int], schema=None):
         pass
 
-    def get(self, *_): return bool(self)
-    def has(self, val): return bool(self) == val
+    # the value is fixed at construction, so the bool form is computed once in __new__
+    def get(self, *_): return self._native
+    def has(self, val): return self._native == val
     def set(self, _, val): pass
     def remove(self, _): pass
-    def to_native(self): return bool(self)
-    def to_json(self): return bool(self)
-
-    def __bool__(self): return int(self) == 1
-    def __str__(self): return str(bool(self))
-    def __repr__(self): return repr(bool(self))
-    def __eq__(self, other): return bool(self) == bool(other)
-    def __hash__(self): return self.to_native()
+    def to_native(self): return self._native
+    def to_json(self): return self._native
+
+    def __bool__(self): return self._native
+    def __str__(self): return "True" if self._native else "False"
+    def __repr__(self): return "True" if self._native else "False"
+
+    def __eq__(self, other):
+        if other is self:
+            return True
+        if other.__class__ is bool:
+            return self._native is other
+        return self._native == bool(other)
+
+    __hash__ = int.__hash__  # equals hash(True) / hash(False)
     def __setitem__(self, key, value): pass
 
-    def __getitem__(self, item): return bool(self)
+    def __getitem__(self, item): return self._native
 
 
 MetaBool.__name__ = "MetaBool"
 MetaBool.__qualname__ = "MetaBool"
 MetaBool.__module__ = "__main__"
 
+_NONE_HASH = hash(None)
+
+
 # --- MetaBool: Wrapper for None bool behavior ---
 class MetaNone(MetaNodeMixin):
-    def __new__(cls, *args, **kwargs):
+    __slots__ = ("schema",)
+    validator = _shared_validator_property
+
+    def __new__(cls, *args, schema=None, **kwargs):
+        # schema-less MetaNone() values are indistinguishable, so they share one instance
+        if cls is MetaNone and schema is None:
+            return _META_NONE
         return super().__new__(cls)
 
     def __init__(self, *args, schema=None, **kwargs):
-        MetaNodeMixin.__init__(self, schema=schema)
+        # nothing to initialise underneath, so skip MetaNodeMixin.__init__ and its super() probe
+        self.schema = schema
+        if schema is not None:
+            try:
+                self.validator.validate_all(self)
+            except Exception as e:
+                raise TypeError(f"[ValidationError in {self.__class__.__name__}] {e}")
 
     def get(self, *_): return None
     def has(self, _): return False
@@ -154,7 +307,7 @@ class MetaNone(MetaNodeMixin):
     def __repr__(self): return "None"
     def __str__(self): return "None"
     def __eq__(self, other): return other is None or isinstance(other, MetaNone)
-    def __hash__(self): return None
+    def __hash__(self): return _NONE_HASH
     def __bool__(self): return False
     def __setitem__(self, key, value): pass
     def __getitem__(self, item): return None
@@ -163,3 +316,18 @@ MetaNone.__name__ = "MetaNone"
 MetaNone.__qualname__ = "MetaNone"
 MetaNone.__module__ = "__main__"
 
+# the shared schema-less MetaNone; give it a schema through attach_schema, never by assignment
+_META_NONE = object.__new__(MetaNone)
+_META_NONE.schema = None
+
+
+def attach_schema(node: MetaNodeMixin, schema):
+    """
+    Point an existing node at a new schema and return the node to keep.
+    The shared MetaNone is swapped for a fresh instance rather than modified in place.
+    """
+    if node is _META_NONE:
+        return MetaNone(schema=schema)
+    node.schema = schema
+    return node
+
@@ -3,13 +3,16 @@
 # - Each Meta* type gets injected CRUD + to_json/to_native logic
 # - Methods are chainable where appropriate
 
+import os
 from typing import Any, Type, Union, get_origin, get_args, Iterable
-from Meta.helpers import resolve_schema_key
-from Meta.meta_base import MetaNodeMixin, MetaBool, MetaNone
+from Meta.meta_base import MetaNodeMixin, MetaBool, MetaNone, attach_schema
 from Meta.schema_validator import SchemaValidator, NoOpValidator
 from Meta.schema import Schema
-from Meta.helpers import coerce_dict_keys
-from schema import fill_missing_keys
+from Meta.helpers import coerce_dict_keys, _transform_iteratively, _build_dict
+from schema import fill_missing_with_plan, key_coercer_chain, coerce_with_plan
+
+# META_DEBUG=1 turns on the extra construction-time checks; python -O drops them regardless
+_DEBUG = __debug__ and bool(os.environ.get("META_DEBUG"))
 
 
 def get_default_value_from_type(tp: Any):
@@ -55,6 +58,241 @@ def get_default_value_from_type(tp: Any):
     return None
 
 
+def _frozen_step(value, _):
+    # hashable mirror of to_native: dicts -> frozenset of items, lists/tuples -> tuple, sets -> frozenset
+    if isinstance(value, dict):
+        items = list(value.items())
+        keys = [k for k, _ in items]
+        return (lambda results: frozenset(zip(keys, results))), [(v, None) for _, v in items]
+    if isinstance(value, (list, tuple)):
+        return tuple, [(v, None) for v in value]
+    if isinstance(value, (set, frozenset)):
+        return frozenset, [(v, None) for v in value]
+    if isinstance(value, MetaNodeMixin):
+        return None, value.to_native()
+    return None, value
+
+
+# Per-node attributes live in slots rather than a __dict__.
+_NODE_SLOTS = ("schema", "validator")
+# int and tuple subclasses can't take non-empty __slots__, so those nodes keep their __dict__
+_DICT_BACKED = (int, tuple)
+
+
+# --- to_native / to_json steps for helpers._transform_iteratively ---
+# Container nodes expand into their children; every other node converts itself and plain values pass through.
+def _native_step(value, _):
+    if not isinstance(value, MetaNodeMixin):
+        return None, value
+    if isinstance(value, dict):
+        keys = [k.to_native() if isinstance(k, MetaNodeMixin) else k for k in value]
+        return _build_dict(keys), [(v, None) for v in value.values()]
+    if isinstance(value, list):
+        return list, [(v, None) for v in value]
+    if isinstance(value, set):
+        return set, [(v, None) for v in value]
+    if isinstance(value, tuple):
+        return tuple, [(v, None) for v in value]
+    return None, value.to_native()
+
+
+def _json_step(value, _):
+    if not isinstance(value, MetaNodeMixin):
+        return None, value
+    if isinstance(value, dict):
+        return _build_dict(list(value)), [(v, None) for v in value.values()]
+    if isinstance(value, (list, set, tuple)):
+        return list, [(v, None) for v in value]
+    return None, value.to_json()
+
+
+# --- Container methods, one variant per container type; create_meta_node_class installs the matching one ---
+def _pull_args_dict(self, *args):
+    if not args:
+        raise ValueError("No arguments supplied to add")
+    if len(args) == 1 and isinstance(args[0], dict):
+        # for .update() etc
+        return args[0], None
+    elif len(args) == 2:
+        return args[0], args[1]
+    else:
+        raise ValueError("Invalid number of arguments for dict.add()")
+
+
+def _pull_args_list(self, *args):
+    if not args:
+        raise ValueError("No arguments supplied to add")
+    # list.add(x) or list.add(index, x)
+    if len(args) == 1:
+        return None, args[0]
+    elif len(args) == 2:
+        return args[0], args[1]
+    else:
+        raise ValueError("Too many arguments for list.add()")
+
+
+def _pull_args_set(self, *args):
+    if not args:
+        raise ValueError("No arguments supplied to add")
+    # Always treat the first arg as value; set.add(x)
+    return None, args[0]
+
+
+def _pull_args_tuple(self, *args):
+    if not args:
+        raise ValueError("No arguments supplied to add")
+    raise NotImplementedError(f"_pull_args not supported for {tuple}")
+
+
+def _chain_result(self, val):
+    if isinstance(val, MetaNodeMixin) and isinstance(val, (dict, list, set)):
+        return val  # Only return for chaining on containers
+    return self
+
+
+def _add_dict(self, *args, **kwargs):
+    k, v = self._pull_args(*args)
+    if isinstance(k, str) and k.isnumeric():
+        k = int(k)
+    resolved = Schema.ensure(self.resolve_schema(k, v))
+    val = wrap_meta_structure(v, resolved)
+    dict.__setitem__(self, k, val)
+    return _chain_result(self, val)
+
+
+def _add_list(self, *args, **kwargs):
+    k, v = self._pull_args(*args)
+    resolved = Schema.ensure(self.resolve_schema(k, v))
+    val = wrap_meta_structure(v, resolved)
+
+    if len(args) == 1:
+        list.append(self, val)
+
+    elif isinstance(k, int):
+        # insert at index
+        list.insert(self, k, val)
+
+    elif k is not None and k in self:
+        # one pass: stop if val is already present, otherwise note where k first appears
+        unwrap = self._unwrap
+        native_val, native_k = unwrap(val), unwrap(k)
+        idx = None
+        for i, item in enumerate(self):
+            native = unwrap(item)
+            if native == native_val:
+                break
+            if idx is None and native == native_k:
+                idx = i
+        else:
+            if idx is not None:
+                self.insert(idx, val)
+
+    else:
+        list.append(self, val)
+
+    return _chain_result(self, val)
+
+
+def _add_set(self, *args, **kwargs):
+    self._pull_args(*args)
+    val = args[0]
+
+    if isinstance(val, Iterable) and not isinstance(val, (str, dict, MetaDict)):
+        for item in val:
+            resolved = self.resolve_schema(item, item)
+            wrapped = wrap_meta_structure(item, resolved)
+            set.add(self, wrapped)
+    else:
+        resolved = self.resolve_schema(val, val)
+        wrapped = wrap_meta_structure(val, resolved)
+        set.add(self, wrapped)
+
+    return _chain_result(self, val)
+
+
+def _immutable_tuple(self, *args, **kwargs):
+    self._pull_args(*args)  # rejects every call first, as the generic path did
+    raise TypeError("Tuples are immutable; use .set(new_values) instead")
+
+
+def _remove_dict(self, key):
+    try:
+        dict.pop(self, key, None)
+    except Exception:
+        pass  # e.g. an unhashable key
+    return self
+
+
+def _remove_list(self, key):
+    try:
+        if isinstance(key, int):
+            list.pop(self, key)
+        else:
+            list.remove(self, key)
+    except Exception:
+        pass
+    return self
+
+
+def _remove_set(self, key):
+    try:
+        set.discard(self, key)
+    except Exception:
+        pass  # e.g. an unhashable key
+    return self
+
+
+def _remove_tuple(self, key):
+    # Tuples are immutable; use .set(new_values) with modified values
+    return self
+
+
+def _get_dict(self, key, default=None, **kwargs):
+    return dict.get(self, key, default)
+
+
+def _get_sequence(self, key, default=None, **kwargs):
+    if isinstance(key, int):
+        return self[key] if 0 <= key < len(self) else default
+    for idx, val in enumerate(self):
+        if val == key:
+            return idx
+    return default
+
+
+def _get_set(self, key, default=None, **kwargs):
+    return key if key in self else default
+
+
+def _pop_dict(self, *args, **kwargs):
+    k, v = self._pull_args(*args)
+    return dict.pop(self, k, v)
+
+
+def _pop_list(self, *args, **kwargs):
+    k, v = self._pull_args(*args)
+    try:
+        return list.pop(self, k)
+    except IndexError:
+        return v
+
+
+def _pop_set(self, *args, **kwargs):
+    _, v = self._pull_args(*args)
+    value = args[0]
+    if value in self:
+        set.remove(self, value)
+        return value
+    return v
+
+
+_PULL_ARGS = {dict: _pull_args_dict, list: _pull_args_list, set: _pull_args_set, tuple: _pull_args_tuple}
+_ADD = {dict: _add_dict, list: _add_list, set: _add_set, tuple: _immutable_tuple}
+_REMOVE = {dict: _remove_dict, list: _remove_list, set: _remove_set, tuple: _remove_tuple}
+_GET = {dict: _get_dict, list: _get_sequence, set: _get_set, tuple: _get_sequence}
+_POP = {dict: _pop_dict, list: _pop_list, set: _pop_set, tuple: _immutable_tuple}
+
+
 def create_meta_node_class(container_type: Type, name: str = None):
     if container_type is bool:
         return MetaBool
@@ -63,13 +301,19 @@ def create_meta_node_class(container_type: Type, name: str = None):
     # --- Scalar Type (str, int, float) ---
     if container_type in (str, int, float, type(None)):
         class MetaScalar(container_type, MetaNodeMixin):
+            if container_type not in _DICT_BACKED:
+                __slots__ = _NODE_SLOTS
+
             def __new__(cls, value, schema=None, **kwargs):
-                assert isinstance(schema, Schema), "Expected Schema instance"
+                if _DEBUG:
+                    assert isinstance(schema, Schema), "Expected Schema instance"
 
                 instance = super().__new__(cls, value)
                 instance.schema = schema
                 instance.validator = schema.build_validator()
-                instance.validator.type_check(value, schema.schema, key_path=name)
+                if _DEBUG:
+                    # MetaNodeMixin.__init__ validates the finished node anyway; this only fails earlier
+                    instance.validator.bind(schema.schema, name)(value)
                 return instance
 
                 # return instance
@@ -90,16 +334,22 @@ def create_meta_node_class(container_type: Type, name: str = None):
     # --- Container Types ---
     name = name or f"Meta{container_type.__name__.capitalize()}"
     default_factory = dict if container_type is dict else list if container_type is list else set
+    # bound once here rather than resolved through super() on every assignment; sets and tuples have none
+    base_setitem = getattr(container_type, "__setitem__", None)
 
     # --- Container Meta Class ---
     class MetaContainer(container_type, MetaNodeMixin):
+        if container_type not in _DICT_BACKED:
+            __slots__ = _NODE_SLOTS
+
         def __new__(cls, data=None, schema=None, **kwargs):
-            assert isinstance(schema, Schema), "Expected Schema instance"
+            if _DEBUG:
+                assert isinstance(schema, Schema), "Expected Schema instance"
 
 
             # return instance
-            if cls is MetaTuple:
-                args = get_args(schema) if schema else ()
+            if container_type is tuple:
+                args = schema._args
                 if args and args[-1] is Ellipsis:
                     item_schema = args[0]
                     items = tuple(
@@ -118,54 +368,38 @@ def create_meta_node_class(container_type: Type, name: str = None):
 
             instance = super().__new__(cls)
             instance.schema = schema
-            instance.validator = SchemaValidator(schema, MetaNodeMixin)
+            instance.validator = schema.build_validator()
             return instance
 
         def __init__(self, data=None, schema=None, **kwargs):
 
             data = data if data is not None else default_factory()
             self.schema = schema
-            self.validator = SchemaValidator(schema, MetaNodeMixin)
+            self.validator = schema.build_validator()
             if container_type is tuple:
-                # All init work was already done in __new__
+                # tuples are immutable; their items were wrapped once in __new__
                 return
 
-            if isinstance(self, dict) and isinstance(data, dict):
-
+            # contents are wrapped up front and installed in one C-level call, bypassing our __setitem__/append
+            if container_type is dict and isinstance(data, dict):
+                payload = {}
+                coerce_key, resolve_key = self.schema._coerce_key, self.schema._resolve_key
                 for k, v in data.items():
-                    coerced_k = self._coerce_key_type(k)
-                    resolved = Schema.ensure(self.resolve_schema(coerced_k, v))
-                    if isinstance(v, dict) and isinstance(resolved, dict):
-                        wrapped = wrap_meta_structure(v, schema=resolved)
-                    else:
-                        wrapped = v if isinstance(v, MetaNodeMixin) else wrap_meta_structure(v, schema=resolved)
-
-                    self[coerced_k] = wrapped
-
-            elif isinstance(self, list) and isinstance(data, list):
-                for item in data:
-                    resolved_schema = Schema.ensure(self.validator.validate_recursive(None, item) if self.validator else None)
-                    wrapped = item if isinstance(item, MetaNodeMixin) else wrap_meta_structure(item, resolved_schema)
-                    self.append(wrapped)
-
-            elif isinstance(self, tuple) and isinstance(data, tuple):
-                args = get_args(self.schema) if self.schema else ()
-                if args and args[-1] is Ellipsis:
-                    item_schema = args[0]
-                    items = tuple(
-                        wrap_meta_structure(i, schema=Schema.ensure(item_schema)) if not isinstance(i, MetaNodeMixin) else i
-                        for i in data
-                    )
-                else:
-                    items = tuple(
-                        wrap_meta_structure(i, schema=Schema.ensure(s)) if not isinstance(i, MetaNodeMixin) else i
-                        for i, s in zip(data, args)
-                    )
-
-                tmp = type(self)(items)
-                self += tmp  # mutable hack – relies on `tuple` subclassing
-
-            elif isinstance(self, set) and isinstance(data, set):
+                    coerced_k = coerce_key(k)
+                    # key is already coerced, so resolve it directly rather than through resolve_schema
+                    payload[coerced_k] = v if isinstance(v, MetaNodeMixin) else wrap_meta_structure(
+                        v, schema=Schema.ensure(resolve_key(coerced_k)))
+                dict.update(self, payload)
+
+            elif container_type is list and isinstance(data, list):
+                validator = self.validator
+                list.extend(self, [
+                    item if isinstance(item, MetaNodeMixin) else wrap_meta_structure(
+                        item, Schema.ensure(validator.validate_recursive(None, item) if validator else None))
+                    for item in data
+                ])
+
+            elif container_type is set and isinstance(data, set):
                 for item in data:
                     resolved_schema = self.validator.validate_recursive(None, item) if self.validator else None
                     wrapped = item if isinstance(item, MetaNodeMixin) else wrap_meta_structure(item, Schema.ensure(resolved_schema))
@@ -175,176 +409,24 @@ def create_meta_node_class(container_type: Type, name: str = None):
                 raise TypeError(f"Unsupported init for {type(self)} with data: {data}")
 
         def _coerce_key_type(self, key):
-            if get_origin(self.schema) is dict:
-                expected_key_type, _ = get_args(self.schema)
-                if expected_key_type is int and isinstance(key, str) and key.isnumeric():
-                    return int(key)
-                elif expected_key_type is float and isinstance(key, str):
-                    try:
-                        return float(key)
-                    except ValueError:
-                        pass
-                elif expected_key_type is bool and key in ("True", "False"):
-                    return key == "True"
-            return key
+            return self.schema._coerce_key(key)
 
         def resolve_schema(self, key, value):
-            key = self._coerce_key_type(key)
-
-            # ✅ Unwrap if self.schema is a Schema instance
-            schema_base = self.schema.schema if isinstance(self.schema, Schema) else self.schema
-
-            if self.validator and isinstance(schema_base, dict):
-                # --- Match exact key ---
-                if key in schema_base:
-                    return schema_base[key]
-
-                # --- Match by key type (e.g., str, int) ---
-                for k_type, v_type in schema_base.items():
-                    if isinstance(k_type, type) and isinstance(key, k_type):
-                        return v_type
-                    if isinstance(k_type, tuple) and any(isinstance(key, t) for t in k_type):
-                        return v_type
-
-            # --- typing.Dict[str, T] form ---
-            origin = get_origin(schema_base)
-            if origin is dict:
-                _, val_type = get_args(schema_base)
-                return val_type
-
-            # --- Normalized schema form: {str: T} ---
-            if isinstance(schema_base, dict):
-                for k_type, v_type in schema_base.items():
-                    if isinstance(k_type, type) and isinstance(key, k_type):
-                        return v_type
-                    if isinstance(k_type, tuple) and any(isinstance(key, t) for t in k_type):
-                        return v_type
-
-            return None
+            # coercer and resolver were both built once with the Schema
+            schema = self.schema
+            return schema._resolve_key(schema._coerce_key(key))
 
         @staticmethod
         def _unwrap(v):
-            return v.to_native() if hasattr(v, "to_native") else v
-
-        def _pull_args(self, *args):
-            if not args:
-                raise ValueError("No arguments supplied to add")
-
-            if container_type is set:
-                # Always treat the first arg as value; set.add(x)
-                return None, args[0]
-
-            if container_type is list:
-                # list.add(x) or list.add(index, x)
-                if len(args) == 1:
-                    return None, args[0]
-                elif len(args) == 2:
-                    return args[0], args[1]
-                else:
-                    raise ValueError("Too many arguments for list.add()")
-
-            if container_type is dict:
-                if len(args) == 1 and isinstance(args[0], dict):
-                    # for .update() etc
-                    return args[0], None
-                elif len(args) == 2:
-                    return args[0], args[1]
-                else:
-                    raise ValueError("Invalid number of arguments for dict.add()")
-
-            raise NotImplementedError(f"_pull_args not supported for {container_type}")
-
-        # --- method overrides ---
-        def add(self, *args, **kwargs):
-            k, v = self._pull_args(*args)
-
-            if container_type is dict:
-                if isinstance(k, str) and k.isnumeric():
-                    k = int(k)
-                resolved = Schema.ensure(self.resolve_schema(k, v))
-                val = wrap_meta_structure(v, resolved)
-                dict.__setitem__(self, k, val)
-
-            elif container_type is list:
-                if len(args) == 1:
-                    resolved = Schema.ensure(self.resolve_schema(k, v))
-                    val = wrap_meta_structure(v, resolved)
-                    # val = wrap_meta_structure(v, schema=self._infer_sub_schema())
-                    list.append(self, val)
-
-                elif len(args) == 2:
-                    if isinstance(k, int):
-                        # insert at index
-                        resolved = Schema.ensure(self.resolve_schema(k, v))
-                        val = wrap_meta_structure(v, resolved)
-                        # val = wrap_meta_structure(v, schema=self._infer_sub_schema())
-                        list.insert(self, k, val)
-
-
-                    elif k is not None and k in self:
-                        resolved = Schema.ensure(self.resolve_schema(k, v))
-                        val = wrap_meta_structure(v, resolved)
-                        existing = [i for i in self if self._unwrap(i) == self._unwrap(val)]
-                        if not existing:
-                            idx = next((i for i, item in enumerate(self) if self._unwrap(item) == self._unwrap(k)), None)
-                            if idx is not None:
-                                self.insert(idx, val)
-                            # self[idx] = val
-
-                    else:
-                        resolved = Schema.ensure(self.resolve_schema(k, v))
-                        val = wrap_meta_structure(v, resolved)
-                        list.append(self, val)
-
-                else:
-                    raise ValueError("Invalid arguments for MetaList.add()")
-
-
-            elif container_type is set:
-                # k = args[0]
-                val = args[0]
-
-                if isinstance(val, Iterable) and not isinstance(val, (str, dict, MetaDict)):
-                    for item in val:
-                        resolved = self.resolve_schema(item, item)
-                        wrapped = wrap_meta_structure(item, resolved)
-                        set.add(self, wrapped)
-                else:
-                    resolved = self.resolve_schema(val, val)
-                    wrapped = wrap_meta_structure(val, resolved)
-                    set.add(self, wrapped)
-
-            elif container_type is tuple:
-                raise TypeError("Tuples are immutable; use .set(new_values) instead")
-
-
-            else:
-                raise NotImplementedError(f"Container type {container_type} cannot implement add")
-
-            if isinstance(val, MetaNodeMixin) and isinstance(val, (dict, list, set)):
-                return val  # Only return for chaining on containers
-            return self
-            # return self
+            return v.to_native() if isinstance(v, MetaNodeMixin) else v
 
-        def remove(self, key):
-            try:
-                if container_type is dict:
-                    dict.pop(self, key, None)
-                elif container_type is list:
-                    if isinstance(key, int):
-                        list.pop(self, key)
-                    else:
-                        list.remove(self, key)
-                elif container_type is set:
-                    set.discard(self, key)
-                elif container_type is tuple:
-                    raise TypeError("Tuples are immutable; use .set(new_values) with modified values")
-
-                else:
-                    raise NotImplementedError()
-            except Exception:
-                pass
-            return self
+        # --- container-specific variants, chosen once per class ---
+        _pull_args = _PULL_ARGS[container_type]
+        add = _ADD[container_type]
+        remove = _REMOVE[container_type]
+        # TODO Chain get and add missing values if the current one doesn't exist, might need to add a set defaults parameter
+        get = _GET[container_type]
+        pop = _POP[container_type]
 
         def set(self, *args, **kwargs):
 
@@ -363,7 +445,7 @@ def create_meta_node_class(container_type: Type, name: str = None):
                     return self
 
 
-                elif isinstance(self, list):
+                elif container_type is list:
                     if len(args) == 1:
                         new_items = args[0]
                         for v in (new_items if isinstance(new_items, Iterable) else [new_items]):
@@ -377,10 +459,10 @@ def create_meta_node_class(container_type: Type, name: str = None):
                     else:
                         raise ValueError("Invalid arguments for set()")
                     return self
-                elif isinstance(self, set):
+                elif container_type is set:
                     self.update(other if isinstance(other, Iterable) else [other])
 
-                elif isinstance(self, tuple):
+                elif container_type is tuple:
                     data = list(self)
                     data.clear()
                     for val in other:
@@ -393,23 +475,6 @@ def create_meta_node_class(container_type: Type, name: str = None):
                 return self
             raise ValueError("No Arguments Provided in set")
 
-        # TODO Chain get and add missing values if the current one doesn't exist, might need to add a set defaults parameter
-        def get(self, key,  default=None, **kwargs):
-            if container_type is dict:
-                return dict.get(self, key, default)
-            elif container_type is list or container_type is tuple:
-                if isinstance(key, int):
-                    return self[key] if isinstance(key, int) and 0 <= key < len(self) else default
-                else:
-                    for idx, val in enumerate(self):
-                        if val == key:
-                            return idx
-                    return default
-            elif container_type is set:
-                return key if key in self else default
-            else:
-                raise NotImplementedError()
-
         def update(self, *args, **kwargs):
             other, v = self._pull_args(*args)
 
@@ -418,24 +483,21 @@ def create_meta_node_class(container_type: Type, name: str = None):
                     raise TypeError(f"Expected dict-like input for MetaDict.update(), got {type(other)}")
 
                 # ✅ Coerce keys before validation
-                if get_origin(self.schema.schema) is dict:
-                    other = coerce_dict_keys(other, self.schema.schema)
+                if self.schema._origin is dict:
+                    other = coerce_with_plan(other, self.schema.key_coercer_chain())
 
-                try:
-                    for k, v in other.items():
-                        resolved = Schema.ensure(self.resolve_schema(k, v))
+                for k, v in other.items():
+                    resolved = Schema.ensure(self.resolve_schema(k, v))
+                    if _DEBUG:
                         print(f"[DEBUG] Resolved schema for key={k} → {resolved}")
 
-                        wrapped = wrap_meta_structure(v, resolved)
-                        if get_origin(self.schema.schema) is dict:
-                            expected_key_type, value_type = get_args(self.schema.schema)
-                            if not isinstance(k, expected_key_type):
-                                raise TypeError(f"[❌] Invalid key type: {type(k)} → expected {expected_key_type}")
+                    wrapped = wrap_meta_structure(v, resolved)
+                    if self.schema._origin is dict:
+                        expected_key_type, value_type = self.schema._args
+                        if not isinstance(k, expected_key_type):
+                            raise TypeError(f"[❌] Invalid key type: {type(k)} → expected {expected_key_type}")
 
-                        dict.__setitem__(self, k, wrapped)
-                except Exception as e:
-                    print("Schema Validation Failed with Schema: ", self.schema.schema)
-                    raise Exception(str(e))
+                    dict.__setitem__(self, k, wrapped)
 
             elif container_type is list:
                 for v in other:
@@ -448,56 +510,16 @@ def create_meta_node_class(container_type: Type, name: str = None):
 
             return self
 
-        def pop(self, *args, **kwargs):
-            k, v = self._pull_args(*args)
-            if container_type is dict:
-                return dict.pop(self, k, v)
-
-            elif container_type is list:
-                try:
-                    return list.pop(self, k)
-                except IndexError:
-                    return v
-            elif container_type is set:
-                if not args:
-                    return set.pop(self)
-                value = args[0]
-                if value in self:
-                    set.remove(self, value)
-                    return value
-                return v
-            elif container_type is tuple:
-                raise TypeError("Tuples are immutable; use .set(new_values) instead")
-
-                # raise KeyError(f"{value} not found in set")
-            raise TypeError("Instance is not a dict, list, or set")
-
         def has(self, key):
-            if isinstance(self, list):
+            if container_type is list:
                 return key in self or (isinstance(key, int) and 0 <= key < len(self))
             return key in self
 
         def to_native(self):
-            if isinstance(self, dict):
-                return {k.to_native() if hasattr(k, "to_native") else k: v.to_native() if hasattr(v, "to_native") else v for k, v in self.items()}
-            if isinstance(self, set):
-                return set(v.to_native() if hasattr(v, "to_native") else v for v in self)
-            if isinstance(self, list):
-                return [v.to_native() if hasattr(v, "to_native") else v for v in self]
-            elif isinstance(self, tuple):
-                return tuple(v.to_native() if hasattr(v, "to_native") else v for v in self)
-            else:
-                # Probably a scalar
-                return self.to_native()
+            return _transform_iteratively(self, None, _native_step)
 
         def to_json(self):
-            if isinstance(self, dict):
-                return {k: v.to_json() if hasattr(v, "to_json") else v for k, v in self.items()}
-            elif isinstance(self, (list, set, tuple)):
-                return [item.to_json() if hasattr(item, "to_json") else item for item in self]
-            else:
-                # probably a scalar
-                return self.to_json()
+            return _transform_iteratively(self, None, _json_step)
 
         def ensure_iterable(self, v):
             if isinstance(v, (list, set, tuple)):
@@ -509,56 +531,66 @@ def create_meta_node_class(container_type: Type, name: str = None):
                 resolved = Schema.ensure(self.resolve_schema(key, value))
                 wrapped = value if isinstance(value, MetaNodeMixin) else wrap_meta_structure(value, resolved)
                 # Check key type if needed
-                if get_origin(self.schema) is dict:
-                    args = get_args(self.schema)
+                if self.schema._origin is dict:
+                    args = self.schema._args
                     if len(args) >= 1:
                         key_type = args[0]
                         if not isinstance(key, key_type):
                             raise TypeError(f"[❌] Invalid key type: {key} (expected {key_type})")
 
-                super().__setitem__(key, wrapped)
+                base_setitem(self, key, wrapped)
 
-            elif container_type in (list, tuple):
+            elif container_type is list:
                 resolved = Schema.ensure(self.resolve_schema(key, value))
-                wrapped = value if isinstance(value, MetaNodeMixin) else wrap_meta_structure(value, resolved)
-                if isinstance(wrapped, MetaNodeMixin):
-                    wrapped.schema = resolved
-                    wrapped.validator = SchemaValidator(resolved, MetaNodeMixin)
+                if isinstance(value, MetaNodeMixin):
+                    # only an existing node needs re-pointing; a fresh wrap already carries resolved and its validator
+                    wrapped = attach_schema(value, resolved)
+                    wrapped.validator = resolved.build_validator()
+                else:
+                    wrapped = wrap_meta_structure(value, resolved)
 
-                super().__setitem__(key, wrapped)
+                base_setitem(self, key, wrapped)
 
             elif container_type is set:
                 raise TypeError("setitem not supported for sets")
 
+            elif container_type is tuple:
+                raise TypeError("Tuples are immutable; use .set(new_values) instead")
+
             else:
                 resolved = Schema.ensure(self.resolve_schema(key, value))
                 wrapped = value if isinstance(value, MetaNodeMixin) else wrap_meta_structure(value, resolved)
 
-                super().__setitem__(key, wrapped)
-
-        def __getitem__(self, key):
-            return super().__getitem__(key)
+                base_setitem(self, key, wrapped)
 
         def __repr__(self):
-            if isinstance(self, dict):
+            if container_type is dict:
                 return f"{name}({container_type.__repr__(self)})"
             return f"{container_type.__repr__(self)}"
 
         def __hash__(self):
-            return self.to_native()
+            # hash the frozen native form, so nodes hash like their equal natives (tuple, frozenset)
+            if container_type is not tuple:
+                return hash(_transform_iteratively(self, None, _frozen_step))
+            # tuple contents are fixed once built, so their hash is kept
+            try:
+                return self._hash
+            except AttributeError:
+                self._hash = hash(_transform_iteratively(self, None, _frozen_step))
+                return self._hash
 
         def __contains__(self, item):
-            if isinstance(self, dict):
-                return any(
-                    (k.to_native() if isinstance(k, MetaNodeMixin) else k) == item
-                    for k in self.keys()
-                )
-            elif isinstance(self, (list, set)):
-                return any(
-                    item == (v.to_native() if hasattr(v, "to_native") else v)
-                    for v in self
-                )
-            return False
+            if container_type is tuple:
+                return False
+            if container_type is list:
+                # no hash table to lean on, and nodes like MetaBool compare loosely (True == 'x'),
+                # so items are compared in their native form
+                return any(item == (v.to_native() if isinstance(v, MetaNodeMixin) else v) for v in self)
+            # dict keys and set members: the hash lookup only compares the probe against equal-hash entries
+            try:
+                return container_type.__contains__(self, item)
+            except TypeError:
+                return False  # unhashable probe; it can't equal any dict key or set member
 
         def __eq__(self, other):
             return self.to_native() == other
@@ -608,38 +640,14 @@ meta_class_registry = {
     "MetaTuple": MetaTuple
 }
 
-META_TYPES = MetaDict | MetaList | MetaSet | MetaInt | MetaBool | MetaNone | MetaStr | MetaTuple
+META_TYPES = MetaDict | MetaList | MetaSet | MetaInt | MetaFloat | MetaBool | MetaNone | MetaStr | MetaTuple
 
-def coerce_dict_keys(data: dict, schema: Any) -> dict:
-    origin = get_origin(schema)
-    args = get_args(schema)
-
-    # If schema is Dict[K, V]
-    if origin is dict and len(args) == 2:
-        key_type, value_type = args
-
-        def coerce_key(k):
-            if key_type is int and isinstance(k, str) and k.isdigit():
-                return int(k)
-            elif key_type is float and isinstance(k, str):
-                try:
-                    return float(k)
-                except ValueError:
-                    return k
-            return k
-
-        coerced = {}
-        for k, v in data.items():
-            coerced_k = coerce_key(k)
-            # recurse only on nested dicts
-            if isinstance(v, dict):
-                coerced_v = coerce_dict_keys(v, value_type)
-            else:
-                coerced_v = v
-            coerced[coerced_k] = coerced_v
-        return coerced
+_SEQUENCE_TYPES = frozenset((list, set, tuple))
+# scalar nodes whose construction validates them with their Schema's own validator
+_SELF_VALIDATING = frozenset((MetaStr, MetaInt, MetaFloat))
 
-    return data  # no coercion
+def coerce_dict_keys(data: dict, schema: Any) -> dict:
+    return coerce_with_plan(data, key_coercer_chain(schema))
 
 def wrap_meta_structure(data: Any, schema: Any = None, **kwargs):
     """
@@ -647,56 +655,59 @@ def wrap_meta_structure(data: Any, schema: Any = None, **kwargs):
     Each wrapped node will carry its own Schema (with its own validator).
     """
 
-    fill_defaults = kwargs.get("fill_defaults", False)
-
-    if isinstance(data, MetaNodeMixin):
-        if schema is not None:
-            data.schema = schema if isinstance(schema, Schema) else Schema(schema, **kwargs)
-        return data
-
-
+    # exact built-in types hit the registry directly; nodes and subclasses (e.g. OrderedDict) take the slow path
+    base_type = type(data)
+    meta_cls = META_TYPE_MAP.get(base_type)
+    if meta_cls is None:
+        if isinstance(data, MetaNodeMixin):
+            if schema is not None:
+                data = attach_schema(data, schema if isinstance(schema, Schema) else Schema(schema, **kwargs))
+            return data
+        base_type = next((t for t in META_TYPE_MAP if isinstance(data, t)), None)
+        if base_type is None:
+            raise TypeError(f"Unsupported type in wrap_meta_structure: {type(data)}")
+        meta_cls = META_TYPE_MAP[base_type]
 
     schema_obj = schema if isinstance(schema, Schema) else Schema(schema, **kwargs)
 
-    for base_type, meta_cls in META_TYPE_MAP.items():
-        if isinstance(data, base_type):
-
-            if base_type is dict:
-                raw_data = coerce_dict_keys(data, schema_obj.schema)
-                if fill_defaults and isinstance(schema_obj.schema, dict):
-                    fill_missing_keys(raw_data, schema_obj.schema)
-
-                wrapped = {}
-                for k, v in raw_data.items():
-                    coerced_k = schema_obj.coerce_key(k)
-                    sub_schema = schema_obj.resolve_from(coerced_k, v)
-                    wrapped[coerced_k] = wrap_meta_structure(v, schema=sub_schema, **kwargs)
-
-                node = meta_cls(wrapped, schema=schema_obj, **kwargs)
-
-                validator = schema_obj.build_validator()
-                if validator:
-                    validator.validate_all(node)
-                return node
-
-            elif base_type in (list, set, tuple):
-                sub_schema = schema_obj(data)  # still works
-                container_data = [
-                    wrap_meta_structure(i, schema=sub_schema, **kwargs)
-                    for i in data
-                ]
-                node = meta_cls(container_data if base_type != set else set(container_data), schema=schema_obj, **kwargs)
-                validator = schema_obj.build_validator()
-                if validator:
-                    validator.validate_all(node)
-                return node
-
-            else:  # Scalar types
-                node = meta_cls(data, schema=schema_obj, **kwargs)
-                validator = schema_obj.build_validator()
-                if validator:
-                    validator.validate_all(node)
-                # return node
-                return node
-
-    raise TypeError(f"Unsupported type in wrap_meta_structure: {type(data)}")
+    if base_type is dict:
+        # an empty chain (no Dict[K, V] levels) hands back the same dict without walking it
+        raw_data = coerce_with_plan(data, schema_obj.key_coercer_chain())
+        if kwargs.get("fill_defaults", False) and isinstance(schema_obj.schema, dict):
+            fill_missing_with_plan(raw_data, schema_obj.plan)
+
+        wrapped = {}
+        for k, v in raw_data.items():
+            coerced_k = schema_obj.coerce_key(k)
+            sub_schema = schema_obj.resolve_from(coerced_k, v)
+            wrapped[coerced_k] = wrap_meta_structure(v, schema=sub_schema, **kwargs)
+
+        node = meta_cls(wrapped, schema=schema_obj, **kwargs)
+
+        validator = schema_obj.build_validator()
+        if validator:
+            validator.validate_all(node)
+        return node
+
+    elif base_type in _SEQUENCE_TYPES:
+        sub_schema = schema_obj(data)  # still works
+        container_data = [
+            wrap_meta_structure(i, schema=sub_schema, **kwargs)
+            for i in data
+        ]
+        node = meta_cls(container_data if base_type != set else set(container_data), schema=schema_obj, **kwargs)
+        validator = schema_obj.build_validator()
+        if validator:
+            validator.validate_all(node)
+        return node
+
+    else:  # Scalar types
+        node = meta_cls(data, schema=schema_obj, **kwargs)
+        if meta_cls in _SELF_VALIDATING:
+            return node  # MetaNodeMixin.__init__ already ran schema_obj's validator over it
+        validator = schema_obj.build_validator()
+        if validator:
+            validator.validate_all(node)
+        # return node
+        return node
+
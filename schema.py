@@ -1,95 +1,443 @@
 from typing import Any, get_origin, get_args, Union, Dict, List, Set, Tuple
 import types
-from schema_validator import SchemaValidator, NoOpValidator
-from Meta.helpers import get_default_from_type
+from functools import lru_cache
+from Meta.schema_validator import SchemaValidator, NoOpValidator, NOOP_VALIDATOR
+from Meta.helpers import (get_default_from_type, default_factory_for, bucket_schema_keys, _coerce_to_any, _NO_MATCH,
+                          _origin_args, make_key_resolver, _cast_scalar, _coerce_keys, _MISS,
+                          _transform_iteratively, _build_dict)
 
 def fill_missing_keys(data: dict, schema: dict):
-    for key, expected_type in schema.items():
-        if isinstance(key, type):
-            continue  # skip fallback rules like str: set()
+    # explicit stack of (data, schema) pairs instead of recursing into nested dicts
+    stack = [(data, schema)]
+    while stack:
+        data, schema = stack.pop()
+        for key, expected_type in schema.items():
+            if isinstance(key, type):
+                continue  # skip fallback rules like str: set()
+
+            value = data.get(key)
+            if value is None:
+                data[key] = get_default_from_type(expected_type)
+            elif isinstance(value, dict) and isinstance(expected_type, dict):
+                stack.append((value, expected_type))
+
+
+# --- Compiled schema plans ---
+# A plan is a tree of tuples whose first item is the node kind. It is built once
+# per Schema and lets normalize/fill walk the data without re-inspecting the schema.
+_PASS = ("pass",)
+
+
+def compile_plan(schema: Any) -> tuple:
+    if schema is None or schema is Any:
+        return _PASS
+
+    origin, args = _origin_args(schema)
+
+    # --- typing generics ---
+    if origin is dict:
+        key_type, val_type = args if len(args) == 2 else (Any, Any)
+        return "typed_dict", key_type, compile_plan(val_type)
+    if origin is set:
+        return "typed_set", compile_plan(args[0] if args else Any)
+    if origin is list:
+        return "typed_list", compile_plan(args[0] if args else Any)
+    if origin is tuple:
+        if args and args[-1] is Ellipsis:
+            return "typed_tuple", compile_plan(args[0]), ()
+        return "typed_tuple", None, tuple(compile_plan(a) for a in args)
+
+    # --- normalized schemas ---
+    if isinstance(schema, dict):
+        exact = {sk: compile_plan(sv) for sk, sv in schema.items()}
+        typed = tuple((key_types, exact[sk]) for sk, key_types in bucket_schema_keys(schema))
+        defaults = tuple(
+            (sk, default_factory_for(sv), exact[sk] if isinstance(sv, dict) else None)
+            for sk, sv in schema.items() if not isinstance(sk, type)
+        )
+        return "record", exact, typed, defaults
+    if isinstance(schema, set):
+        return ("set", compile_plan(next(iter(schema)))) if len(schema) == 1 else _PASS
+    if isinstance(schema, list):
+        return ("list", compile_plan(schema[0])) if len(schema) == 1 else _PASS
+    if isinstance(schema, tuple):
+        if len(schema) == 2 and schema[1] is Ellipsis:
+            return "tuple", compile_plan(schema[0]), ()
+        return "tuple", None, tuple(compile_plan(s) for s in schema)
+
+    if isinstance(schema, type):
+        return "cast", schema
+    return _PASS
+
+
+# --- normalize_with_plan steps for helpers._transform_iteratively ---
+# Each step returns (None, value) for a finished value, or (build, [(child, child_plan), ...]).
+# Children whose plan is a leaf ("pass"/"cast") are finished in place instead of going through the stack.
+_LEAF_KINDS = frozenset(("pass", "cast"))
+
+
+def _leaf(data, plan):
+    return data if plan[0] == "pass" else _cast_scalar(data, plan[1])
+
+
+def _plan_items(build, items, item_plan):
+    if item_plan[0] in _LEAF_KINDS:
+        return None, build([_leaf(i, item_plan) for i in items])
+    return build, [(i, item_plan) for i in items]
+
+
+def _plan_typed_dict(data, plan):
+    if not isinstance(data, dict):
+        return None, data
+    _, key_type, val_plan = plan
+    return _plan_items(_build_dict(_coerce_keys(data, key_type)), data.values(), val_plan)
+
+
+def _plan_typed_set(data, plan):
+    if isinstance(data, (list, set)):
+        return _plan_items(set, data, plan[1])
+    raise TypeError(f"[normalize_data] Expected set or list, got {type(data)}")
+
+
+def _plan_typed_list(data, plan):
+    if not isinstance(data, list):
+        raise TypeError(f"[normalize_data] Expected list, got {type(data)}")
+    return _plan_items(list, data, plan[1])
+
+
+def _plan_typed_tuple(data, plan):
+    if isinstance(data, list):
+        data = tuple(data)
+    if not isinstance(data, tuple):
+        raise TypeError(f"[normalize_data] Expected tuple, got {type(data)}")
+    return _plan_tuple(data, plan)
+
+
+def _plan_record(data, plan):
+    if not isinstance(data, dict):
+        return None, data
+    _, exact, typed, _ = plan
+    keys, children = [], []
+    for k, v in data.items():
+        sv_plan = exact.get(k)
+        if sv_plan is None:
+            sv_plan = _PASS
+            for key_types, typed_plan in typed:
+                coerced = _coerce_to_any(k, key_types)
+                if coerced is not _NO_MATCH:
+                    k, sv_plan = coerced, typed_plan
+                    break
+        keys.append(k)
+        children.append((v, sv_plan))
+    return _build_dict(keys), children
+
+
+def _plan_set(data, plan):
+    if isinstance(data, (list, set)):
+        return _plan_items(set, data, plan[1])
+    raise TypeError(f"[normalize_data] Expected list or set for set schema, got {type(data)}")
+
+
+def _plan_list(data, plan):
+    if isinstance(data, list):
+        return _plan_items(list, data, plan[1])
+    raise TypeError(f"[normalize_data] Expected list for list schema, got {type(data)}")
 
-        if key not in data or data[key] is None:
-            data[key] = get_default_from_type(expected_type)
-        elif isinstance(data[key], dict) and isinstance(expected_type, dict):
-            fill_missing_keys(data[key], expected_type)
 
-class Schema:
-    def __init__(self, raw_schema: Any, *, validator_cls=SchemaValidator, **kwargs):
-        self.schema = self._normalize_schema(raw_schema) if raw_schema else None
-        self.validator_cls = validator_cls if self.schema and validator_cls else NoOpValidator
-        self._validator_instance = None if self.validator_cls else lambda x: None
-        self.kwargs = kwargs
-        self._validate = kwargs.get("validate", isinstance(self.schema, (dict, list, tuple, set, bool, str, int)))
+def _plan_tuple(data, plan):
+    if isinstance(data, list):
+        data = tuple(data)
+    _, item_plan, item_plans = plan
+    if item_plan is not None:
+        return _plan_items(tuple, data, item_plan)
+    return tuple, list(zip(data, item_plans))
+
 
-    @staticmethod
-    def ensure(value: Any, **kwargs) -> "Schema":
-        return value if isinstance(value, Schema) else Schema(value, **kwargs)
+def _plan_leaf(data, plan):
+    return None, _leaf(data, plan)
 
-    def _normalize_schema(self, schema):
-        origin = get_origin(schema)
-        args = get_args(schema)
 
-        if isinstance(schema, types.UnionType):  # for Python 3.10+ support of X | Y syntax
-            return {self._normalize_schema(arg) for arg in args if arg is not type(None)}
+_PLAN_HANDLERS = {
+    "pass": _plan_leaf,
+    "typed_dict": _plan_typed_dict,
+    "typed_set": _plan_typed_set,
+    "typed_list": _plan_typed_list,
+    "typed_tuple": _plan_typed_tuple,
+    "record": _plan_record,
+    "set": _plan_set,
+    "list": _plan_list,
+    "tuple": _plan_tuple,
+    "cast": _plan_leaf,
+}
 
-        if origin is Union:
-            return {self._normalize_schema(arg) for arg in args if arg is not type(None)}
 
-        if origin in (dict, Dict):
-            key_type, val_type = args if len(args) == 2 else (Any, Any)
-            norm_key = self._normalize_schema(key_type)
-            norm_val = self._normalize_schema(val_type)
-            key_tuple = tuple(tuple(sorted(norm_key, key=lambda t: t.__name__))) if isinstance(norm_key,
-                                                                                               set) else norm_key
-            return {key_tuple: norm_val} if isinstance(key_tuple, tuple) else {key_tuple: norm_val}
+def _plan_step(data, plan):
+    return _PLAN_HANDLERS[plan[0]](data, plan)
 
-        if origin in (list, List):
-            item_type = args[0] if args else Any
-            return [self._normalize_schema(item_type)]
 
-        if origin in (set, Set):
-            item_type = args[0] if args else Any
-            return {self._normalize_schema(item_type)}
+def normalize_with_plan(data: Any, plan: tuple) -> Any:
+    """
+    Same result as normalize_data(data, schema) for the schema the plan was compiled from.
+    Walks with an explicit stack, so deeply nested data can't hit the recursion limit.
+    """
+    if plan[0] in _LEAF_KINDS:
+        return _leaf(data, plan)
+    return _transform_iteratively(data, plan, _plan_step)
 
-        if origin in (tuple, Tuple):
-            if args and args[-1] is Ellipsis:
-                return self._normalize_schema(args[0]), ...
-            return tuple(self._normalize_schema(arg) for arg in args)
 
-        if isinstance(schema, dict):
-            out = {}
-            for k, v in schema.items():
-                norm_key = self._normalize_schema(k)
-                if isinstance(norm_key, set):
-                    norm_key = tuple(sorted(norm_key, key=lambda x: str(x)))
-                out[norm_key if isinstance(norm_key, tuple) and len(norm_key) > 1 else norm_key if not isinstance(
-                    norm_key, tuple) else norm_key[0]] = self._normalize_schema(v)
-            return out
+def fill_missing_with_plan(data: dict, plan: tuple):
+    """
+    Same result as fill_missing_keys(data, schema) for a record plan.
+    """
+    if plan[0] != "record":
+        return
+    # explicit stack of (data, record plan) pairs instead of recursing into nested dicts
+    stack = [(data, plan)]
+    while stack:
+        data, plan = stack.pop()
+        for key, default_factory, nested_plan in plan[3]:
+            # not setdefault: an explicit None is replaced too
+            value = data.get(key)
+            if value is None:
+                data[key] = default_factory()
+            elif nested_plan is not None and isinstance(value, dict):
+                stack.append((value, nested_plan))
+
+
+# --- key coercers for Dict[K, V] schemas, picked once per Schema ---
+def _same_key(key):
+    return key
+
+
+def _int_key(key):
+    return int(key) if isinstance(key, str) and key.isnumeric() else key
+
+
+def _float_key(key):
+    if isinstance(key, str):
+        try:
+            return float(key)
+        except ValueError:
+            pass
+    return key
+
+
+def _bool_key(key):
+    return key == "True" if key in ("True", "False") else key
+
+
+_KEY_COERCERS = {int: _int_key, float: _float_key, bool: _bool_key}
+
+
+def _key_coercer(origin, args):
+    if origin is dict and len(args) == 2:
+        return _KEY_COERCERS.get(args[0], _same_key)
+    return _same_key
+
+
+# --- coerce_dict_keys plans: one key coercer per nested Dict[K, V] level ---
+def _digit_key(key):
+    return int(key) if isinstance(key, str) and key.isdigit() else key
+
+
+def key_coercer_chain(schema: Any) -> tuple:
+    """
+    Coercers for each level of nested Dict[K, V] schemas, outermost first.
+    Only int and float keys are converted; the chain stops at the first level that isn't a Dict.
+    """
+    chain = []
+    origin, args = _origin_args(schema)
+    while origin is dict and len(args) == 2:
+        key_type, schema = args
+        chain.append(_digit_key if key_type is int else _float_key if key_type is float else _same_key)
+        origin, args = _origin_args(schema)
+    return tuple(chain)
+
+
+def coerce_with_plan(data: dict, chain: tuple, depth: int = 0) -> dict:
+    """
+    Same result as coerce_dict_keys(data, schema) for the schema the chain was built from.
+    """
+    if depth >= len(chain):
+        return data
+    coerce = chain[depth]
+    return {coerce(k): coerce_with_plan(v, chain, depth + 1) if isinstance(v, dict) else v
+            for k, v in data.items()}
+
+
+# --- schema normalization ---
+def _normalize_schema(schema):
+    origin, args = _origin_args(schema)
+
+    if isinstance(schema, types.UnionType):  # for Python 3.10+ support of X | Y syntax
+        return {normalize_schema(arg) for arg in args if arg is not type(None)}
+
+    if origin is Union:
+        return {normalize_schema(arg) for arg in args if arg is not type(None)}
+
+    if origin in (dict, Dict):
+        key_type, val_type = args if len(args) == 2 else (Any, Any)
+        norm_key = normalize_schema(key_type)
+        norm_val = normalize_schema(val_type)
+        key_tuple = tuple(tuple(sorted(norm_key, key=lambda t: t.__name__))) if isinstance(norm_key,
+                                                                                           set) else norm_key
+        return {key_tuple: norm_val} if isinstance(key_tuple, tuple) else {key_tuple: norm_val}
+
+    if origin in (list, List):
+        item_type = args[0] if args else Any
+        return [normalize_schema(item_type)]
+
+    if origin in (set, Set):
+        item_type = args[0] if args else Any
+        return {normalize_schema(item_type)}
+
+    if origin in (tuple, Tuple):
+        if args and args[-1] is Ellipsis:
+            return normalize_schema(args[0]), ...
+        return tuple(normalize_schema(arg) for arg in args)
+
+    if isinstance(schema, dict):
+        out = {}
+        for k, v in schema.items():
+            norm_key = normalize_schema(k)
+            if isinstance(norm_key, set):
+                norm_key = tuple(sorted(norm_key, key=lambda x: str(x)))
+            out[norm_key if isinstance(norm_key, tuple) and len(norm_key) > 1 else norm_key if not isinstance(
+                norm_key, tuple) else norm_key[0]] = normalize_schema(v)
+        return out
+
+    return schema
 
+
+# typed=True keeps literal schemas like 1, 1.0 and True apart
+@lru_cache(maxsize=4096, typed=True)
+def _normalize_hashable(schema):
+    return _normalize_schema(schema)
+
+
+def normalize_schema(schema: Any) -> Any:
+    """
+    Normalized form of a raw schema (Dict[K, V] -> {K: V}, List[T] -> [T], Optional/Union -> a set, ...).
+    Hashable inputs such as typing annotations are memoized; raw dict schemas are walked, reusing the cache for their parts.
+    The result may be shared between callers, so it must not be mutated.
+    """
+    try:
+        hash(schema)
+    except TypeError:
+        return _normalize_schema(schema)
+    return _normalize_hashable(schema)
+
+
+# Validators shared by every Schema over the same normalized schema object: (id(schema), cls) -> (schema, validator)
+_VALIDATOR_CACHE_SIZE = 1024
+_VALIDATOR_CACHE: dict = {}
+
+
+def _shared_validator(schema, validator_cls):
+    key = (id(schema), validator_cls)
+    entry = _VALIDATOR_CACHE.get(key)
+    # entries hold their schema, so a cached id can't be reused by another object
+    if entry is not None and entry[0] is schema:
+        return entry[1]
+    validator = validator_cls(schema)
+    if len(_VALIDATOR_CACHE) >= _VALIDATOR_CACHE_SIZE:
+        _VALIDATOR_CACHE.clear()
+    _VALIDATOR_CACHE[key] = (schema, validator)
+    return validator
+
+
+# normalized schema shapes that get a real validator unless validate= says otherwise
+_VALIDATABLE_TYPES = (dict, list, tuple, set, bool, str, int)
+
+# Schema.ensure(raw) results for hashable raw schemas; the same sub-schema recurs at every node of a wrapped structure
+_ENSURE_CACHE_SIZE = 1024
+_ENSURE_CACHE: dict = {}
+
+
+class Schema:
+    # one Schema per sub-schema during wrapping; slots keep each of them free of a __dict__
+    __slots__ = ("schema", "validator_cls", "_validator_instance", "kwargs", "_validate", "_origin", "_args",
+                 "_coerce_key", "_plan", "_key_resolver", "_children", "_key_chain", "_type_keys", "_indexable")
+
+    def __init__(self, raw_schema: Any, *, validator_cls=SchemaValidator, **kwargs):
+        self.schema = normalize_schema(raw_schema) if raw_schema else None
+        self.validator_cls = validator_cls if self.schema and validator_cls else NoOpValidator
+        self._validator_instance = None if self.validator_cls else lambda x: None
+        self.kwargs = kwargs
+        # resolve_from always passes validate through, so children skip the isinstance
+        self._validate = kwargs["validate"] if "validate" in kwargs else isinstance(self.schema, _VALIDATABLE_TYPES)
+        self._origin, self._args = _origin_args(self.schema)
+        self._coerce_key = _key_coercer(self._origin, self._args)
+        self._plan = None
+        self._key_resolver = None
+        self._children = {}
+        self._key_chain = None
+        # type-based dict keys as (types, sub-schema); classified once instead of on every get()
+        self._type_keys = tuple(
+            (key_types, self.schema[sk]) for sk, key_types in bucket_schema_keys(self.schema)
+        ) if isinstance(self.schema, dict) else ()
+        # list/set schemas as a tuple, so resolve_from can index them without copying the set each time
+        self._indexable = tuple(self.schema) if isinstance(self.schema, (list, set)) else ()
+
+    @property
+    def plan(self) -> tuple:
+        if self._plan is None:
+            self._plan = compile_plan(self.schema)
+        return self._plan
+
+    def key_coercer_chain(self) -> tuple:
+        if self._key_chain is None:
+            self._key_chain = key_coercer_chain(self.schema)
+        return self._key_chain
+
+    def _resolve_key(self, key: Any) -> Any:
+        if self._key_resolver is None:
+            self._key_resolver = make_key_resolver(self.schema)
+        return self._key_resolver(key)
+
+    @staticmethod
+    def ensure(value: Any, **kwargs) -> "Schema":
+        # exact Schemas are the common case; subclasses still take the isinstance check
+        if value.__class__ is Schema or isinstance(value, Schema):
+            return value
+        if kwargs:
+            return Schema(value, **kwargs)
+        if value.__class__ is type:
+            interned = _INTERNED.get(value)
+            if interned is not None:
+                return interned
+
+        # raw dicts/lists/sets can be edited in place after caching, so only hashable raw schemas are cached
+        try:
+            hash(value)
+        except TypeError:
+            return Schema(value)
+
+        entry = _ENSURE_CACHE.get(id(value))
+        # entries hold their raw schema, so a cached id can't be reused by another object
+        if entry is not None and entry[0] is value:
+            return entry[1]
+        schema = Schema(value)
+        if len(_ENSURE_CACHE) >= _ENSURE_CACHE_SIZE:
+            _ENSURE_CACHE.clear()
+        _ENSURE_CACHE[id(value)] = (value, schema)
         return schema
 
     def get(self, key: Any) -> Any:
         if isinstance(self.schema, dict):
             # Exact key match
-            if key in self.schema:
+            value = self.schema.get(key, _MISS)
+            if value is not _MISS:
+                return value
+            # Type-based fallback (plain and tuple type keys), over the keys classified at construction
+            for key_types, value in self._type_keys:
+                if isinstance(key, key_types):
+                    return value
+
+        elif isinstance(self.schema, list):
+            # Index-style access
+            if isinstance(key, int) and key < len(self.schema):
                 return self.schema[key]
-            # Type-based fallback
-            for k in self.schema:
-                if isinstance(k, type) and isinstance(key, k):
-                    return self.schema[k]
-                if isinstance(k, tuple) and all(isinstance(t, type) for t in k):
-                    if any(isinstance(key, t) for t in k):
-                        return self.schema[k]
-        if isinstance(self.schema, (list, set, tuple)):
-            # Index-style access or default fallback
-            if isinstance(key, int) and isinstance(self.schema, list) and key < len(self.schema):
-                return self.schema[key]
-
-        if isinstance(key, (str, int, float)):
-            for k in self.schema:
-                if isinstance(k, tuple) and all(isinstance(t, type) for t in k):
-                    if any(isinstance(key, t) for t in k):
-                        return self.schema[k]
 
         raise KeyError(f"Key '{key}' not found in schema")
 
@@ -104,21 +452,11 @@ class Schema:
         schema = self.schema
 
         if isinstance(schema, dict):
-            if key in schema:
-                sub_schema_raw = schema[key]
-            else:
-                for k_type, v_type in schema.items():
-                    if isinstance(k_type, tuple):
-                        if any(isinstance(key, t) for t in k_type):
-                            sub_schema_raw = v_type
-                            break
-                    elif isinstance(k_type, type) and isinstance(key, k_type):
-                        sub_schema_raw = v_type
-                        break
+            sub_schema_raw = self._resolve_key(key)
 
         elif isinstance(schema, (list, set)) and isinstance(key, int):
             try:
-                sub_schema_raw = list(schema)[key]
+                sub_schema_raw = self._indexable[key]
             except IndexError:
                 pass
 
@@ -134,11 +472,16 @@ class Schema:
 
         if isinstance(sub_schema_raw, Schema):
             return sub_schema_raw
-        return Schema(sub_schema_raw, validate=self._validate, validator_cls=self.validator_cls)
+
+        # sub-schemas live inside self.schema, so their ids are stable for this Schema's lifetime
+        child = self._children.get(id(sub_schema_raw))
+        if child is None:
+            child = Schema(sub_schema_raw, validate=self._validate, validator_cls=self.validator_cls)
+            self._children[id(sub_schema_raw)] = child
+        return child
 
     def coerce_key(self, key: Any) -> Any:
-        origin = get_origin(self.schema)
-        args = get_args(self.schema)
+        origin, args = self._origin, self._args
         if origin is dict and len(args) == 2:
             key_type = args[0]
             try:
@@ -147,8 +490,8 @@ class Schema:
                 return key
         return key
 
-    def __getitem__(self, key: Any) -> Any:
-        return self.get(key)
+    # schema[key] is get itself, not a wrapper that calls it
+    __getitem__ = get
 
     def __repr__(self):
         return f"<Schema {self.schema}>"
@@ -173,8 +516,12 @@ class Schema:
         return resolved
 
     def build_validator(self):
-        if not self._validate:
-            return NoOpValidator()
+        if not self._validate or self.validator_cls is NoOpValidator:
+            return NOOP_VALIDATOR
         if self._validator_instance is None:
-            self._validator_instance = self.validator_cls(self.schema)
+            self._validator_instance = _shared_validator(self.schema, self.validator_cls)
         return self._validator_instance
+
+
+# one shared Schema per primitive leaf type; kept out of _ENSURE_CACHE so clearing it never drops them
+_INTERNED = {tp: Schema(tp) for tp in (int, str, float, bool, type(None))}
@@ -1,6 +1,7 @@
-from typing import Any, get_origin, get_args, Union, Dict
-from Meta.helpers import (is_type_match, resolve_schema_key, validate_container_origins,
-                          validate_dict, validate_list, validate_set)
+from typing import Any, Union, Dict
+from Meta.helpers import (compile_type_match, make_key_resolver, validate_container_origins,
+                          validate_dict, validate_list, validate_set, _origin_args, _origin, _args, _MISS,
+                          bucket_schema_keys)
 import types
 
 try:
@@ -9,44 +10,231 @@ except ImportError:
     UnionType = None
 
 def is_union(tp):
-    origin = get_origin(tp)
+    origin = _origin(tp)
     return origin is Union or origin is types.UnionType
 
+
+def _accept(value):
+    return True
+
+
 class NoOpValidator:
+    __slots__ = ()
+
     def validate_all(self, data): pass
     def validate(self, *args, **kwargs): pass
     def type_check(self, *args, **kwargs): pass
+    def check(self, data): return True
+    def bind(self, *args, **kwargs): return _accept
+    def validate_recursive(self, *args, **kwargs): return None
     def validate_flat(self, *args, **kwargs): pass
     # def __call__(self): pass
 
+
+# stateless, so every schema-less node and non-validating Schema shares this one
+NOOP_VALIDATOR = NoOpValidator()
+
+
+_CHECK_CACHE_SIZE = 1024
+
+
+class _KeyPath(list):
+    """
+    Key path as [root, sep, key, sep, key, ...], formatted as "value.a[1]" only when a message is built.
+    """
+    __slots__ = ()
+
+    def __str__(self):
+        parts = [str(self[0])]
+        for i in range(1, len(self), 2):
+            sep, key = self[i], self[i + 1]
+            parts.append(f"[{key}]" if sep == "[" else f".{key}")
+        return "".join(parts)
+
+# Item types a Meta node and its native answer isinstance() for alike (unlike bool/None vs MetaBool/MetaNone)
+_DIRECT_TYPES = frozenset((int, float, str, bytes, list, dict, set, tuple))
+
+
+def _direct_isinstance_arg(expected_type):
+    """
+    expected_type as an isinstance() argument when items can be checked without unwrapping, else None.
+    """
+    if expected_type.__class__ is type:
+        return expected_type if expected_type in _DIRECT_TYPES else None
+    if isinstance(expected_type, tuple) and expected_type and all(
+            t.__class__ is type and t in _DIRECT_TYPES for t in expected_type):
+        return expected_type
+    return None
+
+
+_MetaNodeMixin = None
+
+
+def _meta_node_mixin():
+    # meta_base imports this module, so the mixin is fetched on first use and kept here after that
+    global _MetaNodeMixin
+    if _MetaNodeMixin is None:
+        from Meta.meta_base import MetaNodeMixin
+        _MetaNodeMixin = MetaNodeMixin
+    return _MetaNodeMixin
+
+
 class SchemaValidator:
+    __slots__ = ("schema", "MetaNodeMixin", "strict", "_resolve_key", "_type_keys",
+                 "_checks", "_bound", "_recursive", "_branches", "_unions")
+
     def __init__(self, schema, MetaNode_mixin=None, **kwargs):
         self.schema = schema
         if MetaNode_mixin is None:
-            from Meta.meta_base import MetaNodeMixin as MetaNode_mixin
+            MetaNode_mixin = _meta_node_mixin()
         self.MetaNodeMixin = MetaNode_mixin
         self.strict = kwargs.get("strict", False)
+        self._resolve_key = make_key_resolver(schema)
+        # type-based dict keys as (types, sub-schema), for schema_for's fallback
+        self._type_keys = tuple(
+            (key_types, schema[sk]) for sk, key_types in bucket_schema_keys(schema)
+        ) if isinstance(schema, dict) else ()
+        self._checks = {}
+        self._bound = {}
+        self._recursive = {}
+        self._branches = {}
+        self._unions = {}
+
+    def compile(self, expected_type):
+        """
+        Predicate that is True exactly when type_check(value, expected_type) passes.
+        Built once per expected type; type_check only walks the schema again to report a failure.
+        """
+        entry = self._checks.get(id(expected_type))
+        # entries hold their schema node, so a cached id can't be reused by another object
+        if entry is not None and entry[0] is expected_type:
+            return entry[1]
+        check = self._compile_check(expected_type)
+        if len(self._checks) >= _CHECK_CACHE_SIZE:
+            self._checks.clear()
+        self._checks[id(expected_type)] = (expected_type, check)
+        return check
+
+    def bind(self, expected_type, key_path: str = None):
+        """
+        type_check(value, expected_type, key_path) with expected_type and key_path fixed.
+        Construction sites call it with just the value; bound checks are cached per (schema, key_path).
+        """
+        key = (id(expected_type), key_path)
+        entry = self._bound.get(key)
+        if entry is not None and entry[0] is expected_type:
+            return entry[1]
+
+        check = self.compile(expected_type)
+        type_check = self.type_check
+
+        def bound(value):
+            if not check(value):
+                type_check(value, expected_type, key_path)  # raises with the full message
+
+        if len(self._bound) >= _CHECK_CACHE_SIZE:
+            self._bound.clear()
+        self._bound[key] = (expected_type, bound)
+        return bound
+
+    def _compile_check(self, expected_type):
+        mixin = self.MetaNodeMixin
+
+        def native(value):
+            return value.to_native() if isinstance(value, mixin) else value
+
+        if expected_type is None or expected_type is Any:
+            return _accept
+
+        # --- plain types (or unions of them) that nodes satisfy as-is; no to_native() needed ---
+        direct = _direct_isinstance_arg(expected_type)
+        if direct is not None:
+            return lambda value: isinstance(value, direct)
+
+        # --- normalized Union as a tuple of types ---
+        if isinstance(expected_type, tuple):
+            if all(t.__class__ is type for t in expected_type):
+                return lambda value: isinstance(native(value), expected_type)
+            return lambda value: any(isinstance(native(value), t) for t in expected_type)
+
+        # --- normalized single-type set / list ---
+        if isinstance(expected_type, (set, list)) and len(expected_type) == 1:
+            shape = type(expected_type)
+            item_type = next(iter(expected_type))
+            direct = _direct_isinstance_arg(item_type)
+            if direct is not None:
+                def check_plain_items(value):
+                    value = native(value)
+                    return isinstance(value, shape) and all(isinstance(item, direct) for item in value)
+                return check_plain_items
+
+            item_check = self.compile(item_type)
+
+            def check_items(value):
+                value = native(value)
+                return isinstance(value, shape) and all(item_check(item) for item in value)
+            return check_items
+
+        # --- normalized dict ---
+        if isinstance(expected_type, dict) and len(expected_type) == 1:
+            key_type, val_type = next(iter(expected_type.items()))
+            direct_key, direct_val = _direct_isinstance_arg(key_type), _direct_isinstance_arg(val_type)
+            if direct_key is not None and direct_val is not None:
+                def check_plain_entries(value):
+                    value = native(value)
+                    return isinstance(value, dict) and all(
+                        isinstance(k, direct_key) and isinstance(v, direct_val) for k, v in value.items())
+                return check_plain_entries
+
+            key_check, val_check = self.compile(key_type), self.compile(val_type)
+
+            def check_entries(value):
+                value = native(value)
+                return isinstance(value, dict) and all(key_check(k) and val_check(v) for k, v in value.items())
+            return check_entries
+
+        # --- direct scalar types and typing generics ---
+        match = compile_type_match(expected_type)
+        return lambda value: match(native(value))
 
     def _validate_native(self, data, expected_type, path="value"):
+        self._walk_native(data, expected_type, _KeyPath((path,)))
+
+    def _walk_native(self, data, expected_type, path):
+        # path is extended in place around each step; it only becomes a string if a check raises
         if is_union(expected_type):
             expected_type = self.resolve_union_branch(data, expected_type)
 
-        origin = get_origin(expected_type)
+        origin = _origin(expected_type)
 
         if origin is dict:
-            key_type, val_type = get_args(expected_type)
+            key_type, val_type = _args(expected_type)
+            direct_key, direct_val = _direct_isinstance_arg(key_type), _direct_isinstance_arg(val_type)
             try:
+                # plain-typed entries: one pass of isinstance, walking only to report a failure
+                if direct_key is not None and direct_val is not None and all(
+                        isinstance(k, direct_key) and isinstance(v, direct_val) for k, v in data.items()):
+                    return
                 for k, v in data.items():
-                    self.type_check(k, key_type, f"{path}.key")
-                    self._validate_native(v, val_type, f"{path}.{k}")
+                    path += (".", "key")
+                    self.type_check(k, key_type, path)
+                    path[-1] = k
+                    self._walk_native(v, val_type, path)
+                    del path[-2:]
             except AttributeError as e:
                 msg = f"{str(e)}\nOrigin: {origin}\nExpectedType: {expected_type}\nData: {data}"
                 raise AttributeError(msg)
 
         elif origin in (list, set):
-            (item_type,) = get_args(expected_type)
+            (item_type,) = _args(expected_type)
+            direct = _direct_isinstance_arg(item_type)
+            if direct is not None and all(isinstance(item, direct) for item in data):
+                return
+            path += ("[", None)
             for i, item in enumerate(data):
-                self._validate_native(item, item_type, f"{path}[{i}]")
+                path[-1] = i
+                self._walk_native(item, item_type, path)
+            del path[-2:]
 
         else:
             self.type_check(data, expected_type, path)
@@ -55,16 +243,15 @@ class SchemaValidator:
         self.validate_recursive("value", meta, expected_type)
 
     def _extract_keyval_types(self, expected_type):
-        origin = get_origin(expected_type)
-        args = get_args(expected_type)
+        origin, args = _origin_args(expected_type)
 
         if origin is dict and len(args) == 2:
             return args
 
         elif origin is Union:
             for sub_type in args:
-                if get_origin(sub_type) is dict:
-                    sub_args = get_args(sub_type)
+                if _origin(sub_type) is dict:
+                    sub_args = _args(sub_type)
                     if len(sub_args) == 2:
                         return sub_args
         return None, None
@@ -73,6 +260,10 @@ class SchemaValidator:
         if expected_type is None or expected_type is Any:
             return
 
+        # compiled predicate accepts valid values; only failures walk the schema for the message
+        if self.compile(expected_type)(value):
+            return
+
         if isinstance(value, self.MetaNodeMixin):
             value = value.to_native()
 
@@ -106,12 +297,12 @@ class SchemaValidator:
             if not isinstance(value, dict):
                 raise TypeError(f"[❌] {key_path}: expected a dict, got {type(value)}")
             for k, v in value.items():
-                self.type_check(k, key_type if not isinstance(key_type, tuple) else key_type, f"{key_path}.key")
+                self.type_check(k, key_type, f"{key_path}.key")
                 self.type_check(v, val_type, f"{key_path}.{k}")
             return
 
         # ✅ Handle direct scalar types
-        if not is_type_match(value, expected_type, self.MetaNodeMixin):
+        if not compile_type_match(expected_type)(value):
             raise TypeError(f"[❌] {key_path}: expected {expected_type}, got {type(value)} → {value}")
 
     def validate(self, key, value):
@@ -121,11 +312,12 @@ class SchemaValidator:
         expected_type = None
 
         # 1. Direct key match (exact key like "Title")
-        if isinstance(self.schema, dict) and key in self.schema:
-            expected_type = self.schema[key]
+        if isinstance(self.schema, dict):
+            expected_type = self.schema.get(key, _MISS)
 
         # 2. Fallback match (key type like str, int)
-        elif isinstance(self.schema, dict):
+        if expected_type is _MISS:
+            expected_type = None
             for key_type, value_type in self.schema.items():
                 if isinstance(key_type, type) and isinstance(key, key_type):
                     expected_type = value_type
@@ -137,13 +329,13 @@ class SchemaValidator:
 
         # 4. Validate the value recursively (basic check here)
         if expected_type is not Any:
-            origin = get_origin(expected_type)
+            origin = _origin(expected_type)
 
             # --- Dict[KT, VT]
             if origin is dict:
                 if not isinstance(value, dict):
                     raise TypeError(f"Key '{key}' expects a dict")
-                key_type, val_type = get_args(expected_type)
+                key_type, val_type = _args(expected_type)
                 for k, v in value.items():
                     if not isinstance(k, key_type):
                         raise TypeError(f"Key '{k}' in '{key}' must be {key_type}")
@@ -163,56 +355,57 @@ class SchemaValidator:
         if not is_union(union_type):
             return union_type
 
-        for arg in get_args(union_type):
-            try:
-                # Special case: allow empty containers to match their container type
-                origin = get_origin(arg)
-
-                if origin is dict and isinstance(value, dict) and not value:
-                    return arg  # accept empty dict for Dict
-
-                if origin is list and isinstance(value, list) and not value:
-                    return arg
-
-                if origin is set and isinstance(value, set) and not value:
-                    return arg
-
-                # Otherwise validate normally
-                for curr_arg in get_args(union_type):
-                    try:
-                        SchemaValidator(curr_arg, self.MetaNodeMixin).validate_all(value)
-                        return curr_arg
-                    except TypeError:
-                        continue
-                self.type_check(value, arg)
+        for arg, empty_shape, validator in self._union_branches(union_type):
+            # Special case: allow empty containers to match their container type
+            if empty_shape is not None and isinstance(value, empty_shape) and not value:
+                return arg
 
-            except TypeError:
-                continue
-        for arg in get_args(union_type):
+            # Strict validation attempt
             try:
-                # Handle empty container matches
-                origin = get_origin(arg)
-                if origin is dict and isinstance(value, dict) and not value:
-                    return arg
-                if origin is list and isinstance(value, list) and not value:
-                    return arg
-                if origin is set and isinstance(value, set) and not value:
-                    return arg
-
-                # Strict validation attempt
-                SchemaValidator(arg, self.MetaNodeMixin).validate_all(value)
+                validator.validate_all(value)
                 return arg
-
             except TypeError:
                 continue
 
         raise TypeError(f"[❌] {value!r} did not match any Union types: {union_type}")
 
+    def _union_branches(self, union_type):
+        """
+        (branch, container type an empty value matches or None, branch validator) for each Union arg, in order.
+        Built once per union, so resolving a value doesn't re-read the union's args or each branch's origin.
+        """
+        entry = self._unions.get(id(union_type))
+        # entries hold their union, so a cached id can't be reused by another object
+        if entry is not None and entry[0] is union_type:
+            return entry[1]
+        branches = []
+        for arg in _args(union_type):
+            origin = _origin(arg)
+            empty_shape = origin if origin is dict or origin is list or origin is set else None
+            branches.append((arg, empty_shape, self._branch_validator(arg)))
+        branches = tuple(branches)
+        if len(self._unions) >= _CHECK_CACHE_SIZE:
+            self._unions.clear()
+        self._unions[id(union_type)] = (union_type, branches)
+        return branches
+
+    def _branch_validator(self, arg):
+        # one validator per union branch, reused for every value the union sees
+        entry = self._branches.get(id(arg))
+        # entries hold their branch, so a cached id can't be reused by another object
+        if entry is not None and entry[0] is arg:
+            return entry[1]
+        validator = SchemaValidator(arg, self.MetaNodeMixin)
+        if len(self._branches) >= _CHECK_CACHE_SIZE:
+            self._branches.clear()
+        self._branches[id(arg)] = (arg, validator)
+        return validator
+
     def validate_tuple(self, key_path, value, expected_type):
         if not isinstance(value, tuple):
             raise TypeError(f"{key_path}: expected tuple, got {type(value)}")
 
-        args = get_args(expected_type)
+        args = _args(expected_type)
         if args and args[-1] is Ellipsis:
             subtype = args[0]
             for i, item in enumerate(value):
@@ -229,15 +422,15 @@ class SchemaValidator:
 
         self.type_check(value, expected_type, key_path)
 
-        origin = get_origin(expected_type)
+        origin = _origin(expected_type)
 
         if origin is list or origin is tuple:
-            (item_type,) = get_args(expected_type)
+            (item_type,) = _args(expected_type)
             for i, item in enumerate(value):
                 self.validate_recursive(f"{key_path}[{i}]", item, expected_type=item_type)
 
         elif origin is set:
-            (item_type,) = get_args(expected_type)
+            (item_type,) = _args(expected_type)
             for item in value:
                 self.validate_recursive(f"{key_path}{{{item}}}", item, expected_type=item_type)
 
@@ -258,31 +451,54 @@ class SchemaValidator:
 
     def validate_recursive(self, key_path, value, expected_type=None):
         if expected_type is None:
-            expected_type = resolve_schema_key(key_path, self.schema)
-
-        origin = get_origin(expected_type)
+            expected_type = self._resolve_key(key_path)
+
+        entry = self._recursive.get(id(expected_type))
+        # entries hold their schema node, so a cached id can't be reused by another object
+        if entry is None or entry[0] is not expected_type:
+            entry = (expected_type, self._compile_recursive(expected_type))
+            if len(self._recursive) >= _CHECK_CACHE_SIZE:
+                self._recursive.clear()
+            self._recursive[id(expected_type)] = entry
+        return entry[1](key_path, value)
+
+    def _compile_recursive(self, expected_type):
+        """
+        validate_recursive specialised for one expected type: the origin/union dispatch is decided here once,
+        and values passing the compiled check skip the walk. Failures still take the walk to raise its error.
+        """
+        origin = _origin(expected_type)
 
         # ✅ Handle normalized or typing-based containers
         if origin in (list, set, dict) or isinstance(expected_type, (list, set, dict)):
-            return self.validate_container(key_path, value, expected_type)
+            walk, result = self.validate_container, expected_type
+        elif origin is tuple:
+            walk, result = self.validate_tuple, None
+        elif is_union(expected_type):
+            # the matching branch is the result, so unions always resolve it
+            validate_scalar = self.validate_scalar
+            return lambda key_path, value: validate_scalar(key_path, value, expected_type)
+        else:
+            walk, result = self.validate_scalar, expected_type
 
-        if origin is tuple:
-            return self.validate_tuple(key_path, value, expected_type)
+        check = self.compile(expected_type)
 
-        return self.validate_scalar(key_path, value, expected_type)
+        def validate(key_path, value):
+            if check(value):
+                return result
+            return walk(key_path, value, expected_type)
+        return validate
 
     def schema_for(self, key):
         if isinstance(self.schema, dict):
             # Direct match
-            if key in self.schema:
-                return self.schema[key]
+            expected_type = self.schema.get(key, _MISS)
+            if expected_type is not _MISS:
+                return expected_type
 
             # Type match (including tuple of key types)
-            for k_type, v_type in self.schema.items():
-                if isinstance(k_type, tuple):
-                    if any(isinstance(key, typ) for typ in k_type):
-                        return v_type
-                elif isinstance(k_type, type) and isinstance(key, k_type):
+            for key_types, v_type in self._type_keys:
+                if isinstance(key, key_types):
                     return v_type
 
         raise TypeError(f"[❌] Key '{key}' not allowed by schema")
@@ -315,10 +531,49 @@ class SchemaValidator:
         else:
             self._validate_native(data, expected_type)
 
+    def check(self, data) -> bool:
+        """
+        Boolean form of validate_all: False wherever validate_all would raise.
+        Scalar and native data go through the compiled predicate without raising at all.
+        """
+        if self.schema is None:
+            return True
+
+        expected_type = self.schema
+        try:
+            if isinstance(expected_type, dict) and isinstance(data, dict):
+                for k in data:
+                    if k in expected_type:
+                        continue
+                    matched = False
+                    for allowed_key_type in expected_type.keys():
+                        if isinstance(allowed_key_type, tuple):
+                            if any(isinstance(k, t) for t in allowed_key_type):
+                                matched = True
+                                break
+                        elif isinstance(allowed_key_type, type):
+                            if isinstance(k, allowed_key_type):
+                                matched = True
+                                break
+                    if not matched:
+                        return False
+
+            # both traversals reduce to type_check here, which compile() mirrors exactly
+            is_meta = isinstance(data, self.MetaNodeMixin)
+            if _origin(expected_type) is None and not (is_meta and isinstance(expected_type, (list, set, dict))):
+                return self.compile(expected_type)(data)
+
+            if is_meta:
+                self._validate_meta(data, expected_type)
+            else:
+                self._validate_native(data, expected_type)
+        except Exception:
+            return False
+        return True
+
     def _validate_type(self, expected, value, path="root"):
         # Handle Union[...]
-        origin = get_origin(expected)
-        args = get_args(expected)
+        origin, args = _origin_args(expected)
 
         # --- Any ---
         if expected is Any:
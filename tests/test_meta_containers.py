@@ -0,0 +1,17 @@
+from Meta import Meta
+
+
+def test_list_membership_compares_native_items():
+    # MetaBool(True) == 'x' is truthy-equal, but the native True is not
+    items = Meta([True])
+    assert True in items
+    assert 1 in items
+    assert "x" not in items
+    assert [1] not in items
+
+
+def test_set_and_dict_membership():
+    assert "x" not in Meta({True})
+    assert True in Meta({True})
+    assert "x" not in Meta({True: 1})
+    assert [1] not in Meta({"a": 1})